@@ -0,0 +1,56 @@
+"""Benchmarks of client throughput against the local fake API
+
+Run: python benchmarks/bench_client.py -o client.json"""
+
+import asyncio
+import threading
+import time
+
+import pyperf
+
+import toapi
+from toapi.fakeapi import FakeAPI
+
+
+def start_server(latency: float) -> str:
+    """:class:`str`: Starts the fake API in a background thread and returns its
+    origin"""
+    loop = asyncio.new_event_loop()
+    api = FakeAPI(latency=latency)
+    origin = loop.run_until_complete(api.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return origin
+
+
+def bench_crawl(loops: int, origin: str, concurrency: int, users: int) -> float:
+    """:class:`float`: Fetches :param:`users` profiles :param:`loops` times and
+    returns the spent time without setup of the client"""
+    async def crawl() -> float:
+        transport = toapi.AiohttpTransport(origin=origin, limit_per_host=concurrency)
+        async with toapi.Client(transport=transport, coalesce=False) as client:
+            await client.get_user("warmup")
+            started = time.perf_counter()
+            for loop in range(loops):
+                await client.get_users([f"player{loop}-{i}" for i in range(users)], concurrency=concurrency)
+
+            return time.perf_counter() - started
+
+    return asyncio.run(crawl())
+
+
+def main():
+    """The entrypoint of the benchmarks"""
+    runner = pyperf.Runner()
+    runner.argparser.add_argument("--latency", type=float, default=0.005,
+                                  help="The delay (in seconds) of every response of the fake API")
+    runner.argparser.add_argument("--users", type=int, default=200, help="The count of profiles per crawl")
+    args = runner.parse_args()
+
+    origin = start_server(args.latency)
+    for concurrency in (1, 10, 50, 100):
+        runner.bench_time_func(f"get_users[concurrency={concurrency}]", bench_crawl, origin, concurrency, args.users,
+                               inner_loops=args.users)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark of memory retained by models
+
+Run: python benchmarks/bench_memory.py [--count 10000]"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, List
+
+from payloads import profiles, top_lists
+
+from toapi import TopLists, User
+
+
+def retained(build: Callable[[bytes], Any], bodies: List[bytes]) -> float:
+    """:class:`float`: Builds models from the bodies like the client does and
+    returns the count of bytes retained per one model"""
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    models: List[Any] = [build(b) for b in bodies]
+    gc.collect()
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after-before)/len(models)
+
+
+def main():
+    """The entrypoint of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="the count of models to build")
+    args = parser.parse_args()
+
+    # every model is built from its own decoded body, so strings aren't shared between them
+    bodies: List[bytes] = [json.dumps(p).encode() for p in profiles(args.count)]
+    tops: List[bytes] = [json.dumps(top_lists(100)).encode()]*max(args.count//400, 1)
+
+    print(f"User:     {retained(lambda b: User.from_json(json.loads(b)), bodies):10.0f} bytes")
+    print(f"TopLists: {retained(lambda b: TopLists.from_json(json.loads(b)), tops):10.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
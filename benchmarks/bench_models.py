@@ -0,0 +1,53 @@
+"""Benchmarks of decoding and building models
+
+Run: python benchmarks/bench_models.py -o models.json"""
+
+import json
+
+import pyperf
+from payloads import article_page, large_profile, profiles, top_lists
+
+from toapi import Article, PartialUser, TopLists, User
+from toapi.decoders import available_decoders, get_decoder
+
+try:
+    from toapi.schemas import decode_tops_response, decode_user_response
+
+except ModuleNotFoundError:
+    decode_tops_response = decode_user_response = None
+
+
+def main():
+    """The entrypoint of the benchmarks"""
+    runner = pyperf.Runner()
+
+    profile = large_profile()
+    tops = top_lists(1000)
+    page = article_page(100)
+    profile_body = json.dumps({"responseType": "OK", "response": profile}).encode()
+    tops_body = json.dumps({"responseType": "OK", "response": tops}).encode()
+
+    for name in available_decoders():
+        decode = get_decoder(name)[1]
+        runner.bench_func(f"decode_profile[{name}]", decode, profile_body)
+        runner.bench_func(f"decode_tops[{name}]", decode, tops_body)
+
+    runner.bench_func("User.from_json", User.from_json, profile)
+    runner.bench_func("User.from_json[lazy]", lambda: User.from_json(profile, lazy=True).kd_ratio)
+    runner.bench_func("TopLists.from_json", TopLists.from_json, tops)
+    runner.bench_func("Article.from_json[page]", lambda: [Article.from_json(a) for a in page])
+
+    if decode_user_response is not None:
+        runner.bench_func("decode_user_response", decode_user_response, profile_body)
+        runner.bench_func("decode_tops_response", decode_tops_response, tops_body)
+
+    users = [User.from_json(p) for p in profiles(1000)]
+    copies = [User.from_json(p) for p in profiles(1000)]
+    # only `PartialUser` is hashable, because dataclasses based on it generate their own `__eq__`
+    partial = [PartialUser(u.name, u.rank, u.premium) for u in users]
+    runner.bench_func("hash[1000 users]", lambda: set(partial))
+    runner.bench_func("eq[1000 users]", lambda: [a == b for a, b in zip(users, copies)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Synthetic payloads of the API for benchmarks"""
+
+from typing import Any, Dict, List
+
+from toapi.fakeapi import FakeAPI
+
+GEAR_KEYS = ("hullsPlayed", "turretsPlayed", "paintsPlayed", "dronesPlayed", "resistanceModules")
+
+
+def large_profile(name: str = "benchmark", *, scale: int = 5) -> Dict[str, Any]:
+    """Dict[:class:`str`, :class:`Any`]: Generates the profile where every list
+    of game objects is repeated :param:`scale` times"""
+    profile: Dict[str, Any] = FakeAPI().make_profile(name)
+    for key in GEAR_KEYS:
+        profile[key] = [dict(item, id=item["id"]+index) for index in range(scale) for item in profile[key]]
+
+    return profile
+
+
+def profiles(count: int) -> List[Dict[str, Any]]:
+    """List[Dict[:class:`str`, :class:`Any`]]: Generates profiles of different
+    players"""
+    api: FakeAPI = FakeAPI()
+    return [api.make_profile(f"player{i}") for i in range(count)]
+
+
+def top_lists(size: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+    """Dict[:class:`str`, List[Dict[:class:`str`, :class:`Any`]]]: Generates the
+    tops of players"""
+    return FakeAPI().make_tops(size)
+
+
+def article_page(count: int = 100) -> List[Dict[str, Any]]:
+    """List[Dict[:class:`str`, :class:`Any`]]: Generates the page of articles
+    with content and comments"""
+    api: FakeAPI = FakeAPI(articles=count)
+    return [api.make_article(i, full=True) for i in range(count, 0, -1)]
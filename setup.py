@@ -60,6 +60,7 @@ if __name__ == "__main__":
         install_requires=read_requirements("requirements.txt"),
         extras_require={
             "speedup": read_requirements("requirements/speedup.txt"),
+            "analytics": read_requirements("requirements/analytics.txt"),
             "dev": read_requirements("requirements/dev.txt")
         },
 
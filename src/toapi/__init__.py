@@ -6,12 +6,21 @@ The above copyright notice and this permission notice shall be included in all c
 
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
+from .cache import *
+from .cassette import *
 from .client import *
 from .errors import *
+from .frame import *
+from .hooks import *
+from .metrics import *
+from .ratelimit import *
+from .retry import *
+from .transport import *
 from .types import *
+from .watermark import *
 
 __name__ = "tankio_api"
 __author__ = "stngularity"
 __license__ = "MIT"
 __copyright__ = "Copyright 2023-present stngularity"
-__version__ = "1.1.0a4"
+__version__ = "1.1.0a5"
@@ -0,0 +1,149 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Final, Mapping, Optional, Tuple
+
+__all__ = ("ResponseCache", "DEFAULT_TTLS")
+
+
+DEFAULT_TTLS: Final[Mapping[str, float]] = {
+    "/top": 300.0,
+    "/profile": 60.0,
+    "/status.js": 30.0,
+    "/public_test": 30.0,
+    "/balancer": 30.0,
+    "/articles": 600.0,
+    "/comments": 60.0
+}
+
+
+class ResponseCache:
+    """The in-memory LRU cache for decoded responses of API
+
+    The time to live of each entry is chosen by the path of the request
+    endpoint: the longest key of :attr:`ttls` that the path starts with is
+    used. Responses of endpoints without policy aren't cached. Cached payloads
+    are shared between callers, so they mustn't be modified
+    
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum count of entries. When it's exceeded, then the least
+        recently used entry is evicted. By default, `1024`
+        
+    ttls: Optional[Mapping[:class:`str`, :class:`float`]]
+        The mapping where key is a path prefix of endpoint and value is time
+        (in seconds) to live of its responses. If `None`, then uses
+        :data:`DEFAULT_TTLS`. By default, `None`
+    
+    Attributes
+    ----------
+    hits: :class:`int`
+        The count of requests that were served from the cache
+        
+    misses: :class:`int`
+        The count of cacheable requests that weren't found in the cache"""
+
+    def __init__(self, *, maxsize: int = 1024, ttls: Optional[Mapping[str, float]] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("Value of \"maxsize\" parameter must be more than 0")
+
+        self.maxsize: int = maxsize
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self)}, maxsize={self.maxsize}, hit_ratio={self.hit_ratio:.2f})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """:class:`float`: The part of cacheable requests that were served from
+        the cache. If there were no such requests, then it's `0.0`"""
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Optional[:class:`float`]: Gets time to live for responses of endpoint
+        with specified path. If the endpoint isn't cached, then returns `None`
+        
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the endpoint without query. For example, `/profile`"""
+        found: Optional[str] = None
+        for prefix in self.ttls:
+            if path.startswith(prefix) and (found is None or len(prefix) > len(found)):
+                found = prefix
+
+        return None if found is None else self.ttls[found]
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Tuple[:class:`bool`, :class:`Any`]: Gets the entry by the key. Returns
+        pair where first element is whether the entry is found
+        
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the entry"""
+        entry: Optional[Tuple[float, Any]] = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Saves the entry to the cache
+        
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the entry
+            
+        value: :class:`Any`
+            The decoded payload
+            
+        ttl: :class:`float`
+            The time (in seconds) to live of the entry"""
+        self._entries[key] = (time.monotonic()+ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """:class:`int`: Removes entries whose key starts with specified prefix
+        and returns their count. By default, removes all entries
+        
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix of keys. The key is the method and the full URL of the
+            request, for example, `GET https://ratings.tankionline.com/api/eu/top`"""
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters"""
+        self._entries.clear()
+        self.hits, self.misses = 0, 0
@@ -0,0 +1,352 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from multidict import CIMultiDict
+
+from .transport import AiohttpTransport, Transport, TransportResponse
+
+__all__ = ("Cassette", "CassetteEntry", "RecordingTransport", "ReplayTransport")
+
+
+class CassetteEntry:
+    """The recorded response of :class:`Cassette`
+    
+    Attributes
+    ----------
+    status: :class:`int`
+        The HTTP status of the response
+        
+    headers: List[Tuple[:class:`str`, :class:`str`]]
+        The headers of the response
+        
+    body: :class:`str`
+        The `SHA-256` hash of the body
+        
+    headers_time: :class:`float`
+        The time (in seconds) from sending the request to receiving headers
+        
+    body_time: :class:`float`
+        The time (in seconds) of reading the body"""
+
+    __slots__ = ("status", "headers", "body", "headers_time", "body_time")
+
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: str,
+        headers_time: float = 0.0,
+        body_time: float = 0.0
+    ) -> None:
+        self.status: int = status
+        self.headers: List[Tuple[str, str]] = headers
+        self.body: str = body
+        self.headers_time: float = headers_time
+        self.body_time: float = body_time
+
+    def to_json(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, :class:`Any`]: Converts the entry to JSON"""
+        return {"status": self.status, "headers": self.headers, "body": self.body,
+                "headers_time": self.headers_time, "body_time": self.body_time}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CassetteEntry":
+        """:class:`CassetteEntry`: Converts JSON to the entry
+        
+        Parameters
+        ----------
+        data: Dict[:class:`str`, :class:`Any`]
+            The JSON data"""
+        return cls(data["status"], [(h[0], h[1]) for h in data["headers"]], data["body"],
+                   data.get("headers_time", 0.0), data.get("body_time", 0.0))
+
+
+class Cassette:
+    """The storage of recorded requests and responses
+
+    It's a directory with `index.json`, where the key is the method and the
+    URL of the request, and `bodies/`, where bodies of responses are stored
+    compressed by `gzip` and named by their `SHA-256` hash, so equal bodies
+    are stored once. If the same request was recorded many times, then its
+    responses are replayed in the same order, and the last one is repeated
+    
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path to the directory of the cassette. It's created on save"""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path: str = os.fspath(path)
+        self._entries: Dict[str, List[CassetteEntry]] = {}
+
+        index: str = os.path.join(self.path, "index.json")
+        if os.path.exists(index):
+            with open(index, "r", encoding="utf-8") as reader:
+                data: Dict[str, List[Dict[str, Any]]] = json.load(reader)
+
+            self._entries = {k: [CassetteEntry.from_json(e) for e in v] for k, v in data.items()}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, requests={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def keys(self) -> List[str]:
+        """List[:class:`str`]: Gets keys of all recorded requests. The key is the
+        method and the URL of the request, for example,
+        `GET https://ratings.tankionline.com/api/eu/top`"""
+        return list(self._entries)
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.path, "bodies", f"{digest}.gz")
+
+    def read_body(self, digest: str) -> bytes:
+        """:class:`bytes`: Reads the body by its hash
+        
+        Parameters
+        ----------
+        digest: :class:`str`
+            The `SHA-256` hash of the body"""
+        with gzip.open(self._body_path(digest), "rb") as reader:
+            return reader.read()
+
+    def write_body(self, body: bytes) -> str:
+        """:class:`str`: Saves the body, if it isn't saved yet, and returns its
+        hash
+        
+        Parameters
+        ----------
+        body: :class:`bytes`
+            The body of the response"""
+        digest: str = hashlib.sha256(body).hexdigest()
+        path: str = self._body_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, "wb") as writer:
+                writer.write(body)
+
+        return digest
+
+    def bodies(self, prefix: str = "") -> Iterator[bytes]:
+        """:class:`bytes`: Yields bodies of all recorded responses whose key
+        starts with specified prefix. It's useful for benchmarks of parsing,
+        for example, `cassette.bodies("GET https://ratings.tankionline.com/api/eu/profile")`
+        
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix of keys. By default, all bodies are yielded"""
+        for key, entries in self._entries.items():
+            if key.startswith(prefix):
+                for entry in entries:
+                    yield self.read_body(entry.body)
+
+    def add(self, key: str, entry: CassetteEntry) -> None:
+        """Adds the recorded response
+        
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the request
+            
+        entry: :class:`CassetteEntry`
+            The recorded response"""
+        self._entries.setdefault(key, []).append(entry)
+
+    def get(self, key: str, index: int) -> Optional[CassetteEntry]:
+        """Optional[:class:`CassetteEntry`]: Gets the recorded response by the key and
+        its number. If the number is too big, then the last response is
+        returned. If there are no responses, then returns `None`
+        
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the request
+            
+        index: :class:`int`
+            The number of the response, starting from `0`"""
+        entries: Optional[List[CassetteEntry]] = self._entries.get(key)
+        return None if not entries else entries[min(index, len(entries)-1)]
+
+    def save(self) -> None:
+        """Writes the index of the cassette to the disk"""
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "index.json"), "w", encoding="utf-8") as writer:
+            json.dump({k: [e.to_json() for e in v] for k, v in self._entries.items()}, writer, indent=1)
+
+
+class _RecordedResponse(TransportResponse):
+    """The response which is stored in the memory"""
+
+    __slots__ = ("status", "headers", "content_length", "_body", "_body_time")
+
+    def __init__(self, status: int, headers: List[Tuple[str, str]], body: bytes, *, body_time: float = 0.0) -> None:
+        self.status = status
+        self.headers = CIMultiDict(headers)
+        self.content_length = len(body)
+        self._body: bytes = body
+        self._body_time: float = body_time
+
+    async def read(self) -> bytes:
+        if self._body_time > 0:
+            await asyncio.sleep(self._body_time)
+
+        return self._body
+
+    def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        return self._iter_chunked(size)
+
+    async def _iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        body: bytes = await self.read()
+        for index in range(0, len(body), size):
+            yield body[index:index+size]
+
+
+class _RecordingRequest:
+    """The context manager of the request of :class:`RecordingTransport`"""
+
+    __slots__ = ("_transport", "_method", "_url")
+
+    def __init__(self, transport: "RecordingTransport", method: str, url: str) -> None:
+        self._transport: "RecordingTransport" = transport
+        self._method: str = method
+        self._url: str = url
+
+    async def __aenter__(self) -> TransportResponse:
+        started: float = time.perf_counter()
+        async with self._transport.inner.request(self._method, self._url) as response:
+            headers_time: float = time.perf_counter()-started
+            status: int = response.status
+            headers: List[Tuple[str, str]] = list(response.headers.items())
+            body: bytes = await response.read()
+
+        body_time: float = time.perf_counter()-started-headers_time
+        cassette: Cassette = self._transport.cassette
+        cassette.add(f"{self._method} {self._url}",
+                     CassetteEntry(status, headers, cassette.write_body(body), headers_time, body_time))
+        return _RecordedResponse(status, headers, body)
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class _ReplayRequest:
+    """The context manager of the request of :class:`ReplayTransport`"""
+
+    __slots__ = ("_transport", "_key")
+
+    def __init__(self, transport: "ReplayTransport", method: str, url: str) -> None:
+        self._transport: "ReplayTransport" = transport
+        self._key: str = f"{method} {url}"
+
+    async def __aenter__(self) -> TransportResponse:
+        return await self._transport.replay(self._key)
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class RecordingTransport(Transport):
+    """The transport that sends requests through another transport and records
+    all responses to the cassette. Bodies of responses are fully read, so
+    streaming isn't kept while recording
+
+    The index of the cassette is saved on :meth:`close`
+    
+    Parameters
+    ----------
+    cassette: :class:`Cassette`
+        The cassette to record to
+        
+    inner: Optional[:class:`Transport`]
+        The transport which actually sends requests. If `None`, then
+        :class:`AiohttpTransport` with default options is used. By default,
+        `None`"""
+
+    def __init__(self, cassette: Cassette, inner: Optional[Transport] = None) -> None:
+        self.cassette: Cassette = cassette
+        self.inner: Transport = inner or AiohttpTransport()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cassette={self.cassette!r}, inner={self.inner!r})"
+
+    @property
+    def closed(self) -> bool:
+        return self.inner.closed
+
+    def request(self, method: str, url: str) -> AsyncContextManager[TransportResponse]:
+        return _RecordingRequest(self, method, url)
+
+    async def close(self) -> None:
+        """Saves the cassette and closes the inner transport"""
+        self.cassette.save()
+        await self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """The transport that serves responses from the cassette without network
+    
+    Parameters
+    ----------
+    cassette: :class:`Cassette`
+        The cassette to replay
+        
+    timing: :class:`bool`
+        Whether to reproduce recorded time of responses. By default, `False`
+    
+    Raises
+    ------
+    :class:`KeyError`
+        On request, if there is no recorded response to it"""
+
+    def __init__(self, cassette: Cassette, *, timing: bool = False) -> None:
+        self.cassette: Cassette = cassette
+        self.timing: bool = timing
+        self._played: Dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cassette={self.cassette!r}, timing={self.timing})"
+
+    def request(self, method: str, url: str) -> AsyncContextManager[TransportResponse]:
+        return _ReplayRequest(self, method, url)
+
+    async def replay(self, key: str) -> TransportResponse:
+        """:class:`TransportResponse`: Gets the next recorded response to the
+        request
+        
+        Parameters
+        ----------
+        key: :class:`str`
+            The method and the URL of the request"""
+        index: int = self._played.get(key, 0)
+        entry: Optional[CassetteEntry] = self.cassette.get(key, index)
+        if entry is None:
+            raise KeyError(f"The cassette has no response to \"{key}\"")
+
+        self._played[key] = index+1
+        if self.timing and entry.headers_time > 0:
+            await asyncio.sleep(entry.headers_time)
+
+        return _RecordedResponse(entry.status, entry.headers, self.cassette.read_body(entry.body),
+                                 body_time=entry.body_time if self.timing else 0.0)
+
+    def rewind(self) -> None:
+        """Starts replaying responses from the first ones"""
+        self._played.clear()
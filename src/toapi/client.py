@@ -8,15 +8,619 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 
 # pylint: disable=C0103
 
-from typing import Any, List, Mapping
-
+import asyncio
+import time
+from collections import deque
+from datetime import datetime as dt
+from functools import partial
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .cache import ResponseCache
 from .errors import TankiOnlineException, UserNotFoundError
-from .http import request
-from .types import Article, ArticleComment, ESportListResponse, StableServerStatus, TestServerStatus, TopLists, User
-
-__all__ = ("get_tops", "get_user", "get_status", "get_test_status", "get_articles", "get_article_info",
+from .hooks import Hooks, RequestTrace, current_trace
+from .http import HTTPClient, default_http
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .transport import Transport
+from .types import (
+    Article,
+    ArticleComment,
+    ESportListResponse,
+    NodeChange,
+    ServerNode,
+    StableServerStatus,
+    TestServerStatus,
+    TopLists,
+    User,
+)
+from .watermark import Watermark, WatermarkStore
+
+try:
+    from .schemas import decode_tops_response, decode_user_response
+
+except ModuleNotFoundError:
+    decode_tops_response = decode_user_response = None
+
+__all__ = ("Client", "get_tops", "get_user", "get_users", "iter_users", "get_status", "get_test_status",
+           "watch_servers", "get_articles", "iter_articles", "sync_articles", "get_article_info",
            "get_article_comments")
 
+T = TypeVar('T')
+E = TypeVar('E', bound=BaseException)
+
+
+class Client:
+    """The client of Tanki Online's API. It owns one long-lived HTTP session,
+    so all its requests share one pool of connections
+
+    Can be used as an asynchronous context manager, which closes the session
+    on exit. All the methods do the same as module-level functions with the
+    same names
+    
+    Parameters
+    ----------
+    limit_per_host: :class:`int`
+        The maximum count of simultaneous connections to one host. If `0`,
+        then it's unlimited. By default, `10`
+
+    keepalive_timeout: :class:`float`
+        The time (in seconds) during which an idle connection is kept alive.
+        By default, `30.0`
+
+    ttl_dns_cache: Optional[:class:`int`]
+        The time (in seconds) for which resolved DNS records are cached. If
+        `None`, then they are cached forever. By default, `300`
+
+    timeout: Optional[:class:`float`]
+        The total timeout (in seconds) of every request. By default, `None`
+
+    cache: Optional[:class:`ResponseCache`]
+        The cache for decoded responses. If `None`, then responses aren't
+        cached. By default, `None`
+
+    coalesce: :class:`bool`
+        Whether identical requests made at the same time share one request.
+        By default, `True`
+
+    limiter: Optional[:class:`RateLimiter`]
+        The limiter of requests rate. If `None`, then the rate isn't limited.
+        By default, `None`
+
+    retry: Optional[:class:`RetryPolicy`]
+        The policy of repeating failed requests. If `None`, then requests
+        aren't repeated. By default, `None`
+
+    breaker: Optional[:class:`CircuitBreaker`]
+        The circuit breaker, which blocks requests to failing hosts. If
+        `None`, then requests are never blocked. By default, `None`
+
+    decoder: Optional[:class:`str`]
+        The name of JSON backend: `orjson`, `msgspec`, `ujson` or `json`. If
+        `None`, then the fastest installed one is used. By default, `None`
+
+    direct_decode: :class:`bool`
+        Whether to decode responses of :meth:`get_user`, :meth:`get_users` and
+        :meth:`get_tops` straight into the models by declared schemas, without
+        the intermediate :class:`dict`. Requires :mod:`msgspec`. By default,
+        `False`
+
+    lazy: :class:`bool`
+        Whether users received by :meth:`get_user` and :meth:`get_users` build
+        their lists of game objects, modes and supplies and ratings only on the
+        first access (see :meth:`User.from_json`). Ignored with
+        :param:`direct_decode`. By default, `False`
+
+    transport: Optional[:class:`Transport`]
+        The transport which sends requests. If specified, then connection
+        options above are ignored. By default, `None`
+
+    hooks: Optional[:class:`Hooks`]
+        The hooks which are called on stages of every request and on building
+        models. By default, `None`
+
+    metrics: Optional[:class:`Metrics`]
+        The registry of metrics, which is updated by this client. By default,
+        `None`
+    
+    Attributes
+    ----------
+    http: :class:`HTTPClient`
+        The HTTP client which makes all requests of this client"""
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        decoder: Optional[str] = None,
+        direct_decode: bool = False,
+        lazy: bool = False,
+        transport: Optional[Transport] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional[Metrics] = None
+    ) -> None:
+        self.http: HTTPClient = HTTPClient(limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout,
+                                           ttl_dns_cache=ttl_dns_cache, timeout=timeout, cache=cache,
+                                           coalesce=coalesce, limiter=limiter, retry=retry, breaker=breaker,
+                                           decoder=decoder, transport=transport, hooks=hooks)
+        self.direct_decode: bool = direct_decode
+        self.lazy: bool = lazy
+        if direct_decode and decode_user_response is None:
+            raise RuntimeError("\"direct_decode\" requires msgspec to be installed")
+
+        if metrics is not None:
+            metrics.attach(self.http.hooks, cache)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(http={self.http!r})"
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @classmethod
+    def from_http(cls: Type["Client"], http: HTTPClient) -> "Client":
+        """:class:`Client`: Creates the client which makes requests through
+        already existing :class:`HTTPClient`
+        
+        Parameters
+        ----------
+        http: :class:`HTTPClient`
+            The HTTP client to use"""
+        self = cls.__new__(cls)
+        self.http = http
+        self.direct_decode = False
+        self.lazy = False
+        return self
+
+    async def close(self) -> None:
+        """Closes the HTTP session of this client"""
+        await self.http.close()
+
+    def _build(self, model: str, build: Callable[..., T], *args: Any) -> T:
+        """Builds the model of the last response and emits `on_model_built`
+        hook with the time of building"""
+        if not self.http.hooks.active:
+            return build(*args)
+
+        started: float = time.perf_counter()
+        output: T = build(*args)
+        trace: Optional[RequestTrace] = current_trace()
+        if trace is not None:
+            trace.build_time, trace.model = time.perf_counter()-started, model
+            self.http.hooks.emit("on_model_built", trace)
+
+        return output
+
+    def _fail(self, error: E) -> E:
+        """Emits `on_error` hook with the error of the last response, which
+        says that the operation wasn't successful, and returns that error"""
+        if self.http.hooks.active:
+            trace: Optional[RequestTrace] = current_trace()
+            if trace is not None:
+                trace.error = error
+                self.http.hooks.emit("on_error", trace)
+
+        return error
+
+    async def get_tops(self) -> TopLists:
+        """List[:class:`Top`]: Gets list with tops of players. See :func:`get_tops`"""
+        if self.direct_decode and decode_tops_response is not None:
+            tops: Optional[TopLists] = self._build("TopLists", decode_tops_response,
+                                                   await self.http.request("GET", "/top", bytes=True))
+            if tops is None:
+                raise self._fail(TankiOnlineException("Failed to get the tops"))
+
+            return tops
+
+        response: Mapping[str, Any] = await self.http.request("GET", "/top")
+        if response["responseType"] != "OK":
+            raise self._fail(TankiOnlineException("Failed to get the tops"))
+
+        return self._build("TopLists", TopLists.from_json, response["response"])
+
+    async def get_user(self, name: str, *, lang: str = "en") -> User:
+        """:class:`User`: Tries to find user by the name. See :func:`get_user`"""
+        endpoint: str = f"/profile?user={name}&lang={lang}"
+        if self.direct_decode and decode_user_response is not None:
+            user: Optional[User] = self._build("User", decode_user_response,
+                                               await self.http.request("GET", endpoint, bytes=True))
+            if user is None:
+                raise self._fail(UserNotFoundError(name, f"Failed to find player with \"{name}\" name"))
+
+            return user
+
+        response: Mapping[str, Any] = await self.http.request("GET", endpoint)
+        if response["responseType"] == "NOT_FOUND":
+            raise self._fail(UserNotFoundError(name, f"Failed to find player with \"{name}\" name"))
+
+        return self._build("User", partial(User.from_json, lazy=self.lazy), response["response"])
+
+    async def _get_user_or_error(
+        self,
+        name: str,
+        lang: str,
+        semaphore: asyncio.Semaphore
+    ) -> Union[User, UserNotFoundError]:
+        async with semaphore:
+            try:
+                return await self.get_user(name, lang=lang)
+
+            except UserNotFoundError as error:
+                return error
+
+    async def get_users(
+        self,
+        names: Iterable[str],
+        *,
+        lang: str = "en",
+        concurrency: int = 10
+    ) -> List[Union[User, UserNotFoundError]]:
+        """List[Union[:class:`User`, :class:`UserNotFoundError`]]: Tries to find
+        many users at once. See :func:`get_users`"""
+        if concurrency < 1:
+            raise ValueError("Value of \"concurrency\" parameter must be more than 0")
+
+        names = list(names)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        unique: List[str] = list(dict.fromkeys(names))
+        results: List[Union[User, UserNotFoundError]] = await asyncio.gather(
+            *(self._get_user_or_error(n, lang, semaphore) for n in unique))
+
+        found: Dict[str, Union[User, UserNotFoundError]] = dict(zip(unique, results))
+        return [found[n] for n in names]
+
+    async def iter_users(
+        self,
+        names: Iterable[str],
+        *,
+        lang: str = "en",
+        concurrency: int = 10
+    ) -> AsyncGenerator[Tuple[str, Union[User, UserNotFoundError]], None]:
+        """Tuple[:class:`str`, Union[:class:`User`, :class:`UserNotFoundError`]]:
+        Tries to find many users at once and yields them as soon as they are
+        received. See :func:`iter_users`"""
+        if concurrency < 1:
+            raise ValueError("Value of \"concurrency\" parameter must be more than 0")
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        tasks: Dict["asyncio.Task[Union[User, UserNotFoundError]]", str] = {
+            asyncio.ensure_future(self._get_user_or_error(n, lang, semaphore)): n for n in dict.fromkeys(names)}
+
+        try:
+            pending: Any = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield tasks[task], task.result()
+
+        finally:
+            # if the iteration is stopped early, then the rest requests must not leak
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_status(self) -> StableServerStatus:
+        """:class:`StableServerStatus`: Gets the status of stable game server.
+        See :func:`get_status`"""
+        response: Mapping[str, Any] = await self.http.request("GET", "/status.js", base="https://tankionline.com/s")
+        return self._build("StableServerStatus", StableServerStatus.from_json, response)
+
+    async def _get_test_server(
+        self,
+        server: Mapping[str, Any],
+        semaphore: asyncio.Semaphore,
+        timeout: Optional[float]
+    ) -> TestServerStatus:
+        async def get() -> TestServerStatus:
+            base: str = f"https://balancer.{server['Domain']}"
+            response: Mapping[str, Any] = await self.http.request("GET", "/balancer", base=base)
+            return self._build("TestServerStatus", TestServerStatus.from_json, server, response["nodes"])
+
+        async with semaphore:
+            try:
+                # the model is built in the same task as the request, so it's attributed to the trace
+                # of the balancer, not of the list of test servers
+                return await asyncio.wait_for(get(), timeout)
+
+            except Exception as error:  # pylint: disable=W0703
+                return TestServerStatus.from_json(server, {}, error=error)
+
+    async def get_test_status(self, *, concurrency: int = 10, timeout: Optional[float] = 5.0) -> List[TestServerStatus]:
+        """List[:class:`TestServerStatus`]: Gets the status of test game servers.
+        See :func:`get_test_status`"""
+        if concurrency < 1:
+            raise ValueError("Value of \"concurrency\" parameter must be more than 0")
+
+        response: List[Mapping[str, Any]] = await self.http.request("GET", "/public_test",
+                                                                    base="https://test.tankionline.com")
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        return list(await asyncio.gather(*(self._get_test_server(s, semaphore, timeout) for s in response)))
+
+    async def _poll_nodes(
+        self,
+        hashes: Dict[str, int],
+        key: str,
+        endpoint: str,
+        base: str,
+        timeout: Optional[float]
+    ) -> Optional[Dict[str, ServerNode]]:
+        """Optional[Dict[:class:`str`, :class:`ServerNode`]]: Requests the body
+        and parses its nodes only if its hash differs from the previous one of
+        the key. If the body isn't changed or the request or parsing fails, then
+        returns `None`"""
+        try:
+            # the cache would hide changes for its TTL, so it's bypassed
+            body: bytes = await asyncio.wait_for(self.http.request("GET", endpoint, base=base, bytes=True, cache=False),
+                                                 timeout)
+            digest: int = hash(body)
+            if hashes.get(key) == digest:
+                return None
+
+            nodes: Dict[str, ServerNode] = {k: ServerNode.from_json(v, name=k)
+                                            for k, v in self.http.decode(body)["nodes"].items()}
+
+        except Exception:  # pylint: disable=W0703
+            # the failed request or unexpected body keeps the previous state until the next poll
+            return None
+
+        # the hash is saved only after parsing, so the failed body is parsed again on the next poll
+        hashes[key] = digest
+        return nodes
+
+    async def watch_servers(
+        self,
+        *,
+        interval: float = 30.0,
+        test: bool = True,
+        timeout: Optional[float] = 5.0
+    ) -> AsyncGenerator[List[NodeChange], None]:
+        """List[:class:`NodeChange`]: Polls the status of game servers and yields
+        changes of their nodes. See :func:`watch_servers`"""
+        if interval <= 0:
+            raise ValueError("Value of \"interval\" parameter must be more than 0")
+
+        hashes: Dict[str, int] = {}
+        servers: Dict[str, Dict[str, ServerNode]] = {}
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            started: float = loop.time()
+            current: Dict[str, Dict[str, ServerNode]] = {}
+            stable: Optional[Dict[str, ServerNode]] = await self._poll_nodes(hashes, "stable", "/status.js",
+                                                                             "https://tankionline.com/s", timeout)
+            if stable is not None:
+                current["stable"] = stable
+
+            domains: Optional[Dict[str, str]] = None
+            if test:
+                try:
+                    releases: List[Mapping[str, Any]] = await asyncio.wait_for(
+                        self.http.request("GET", "/public_test", base="https://test.tankionline.com", cache=False),
+                        timeout)
+                    domains = {s["Release"]: s["Domain"] for s in releases}
+
+                except Exception:  # pylint: disable=W0703
+                    # test servers keep their nodes until the list of them is received again
+                    domains = None
+
+            if domains is not None:
+                for release in set(servers).difference(domains, ("stable",)):
+                    # the test server is closed, so all its nodes are removed
+                    current[release] = {}
+                    hashes.pop(release, None)
+
+                polled: List[Optional[Dict[str, ServerNode]]] = await asyncio.gather(
+                    *(self._poll_nodes(hashes, r, "/balancer", f"https://balancer.{d}", timeout)
+                      for r, d in domains.items()))
+                current.update((r, n) for r, n in zip(domains, polled) if n is not None)
+
+            changes: List[NodeChange] = []
+            for server, nodes in current.items():
+                changes += NodeChange.diff(server, servers.get(server, {}), nodes)
+                if nodes:
+                    servers[server] = nodes
+
+                else:
+                    servers.pop(server, None)
+
+            if changes:
+                yield changes
+
+            await asyncio.sleep(max(interval-(loop.time()-started), 0.0))
+
+    async def get_articles(self, *, count: int = 20, page: int = 1) -> ESportListResponse[Article]:
+        """:class:`ESportListResponse`[:class:`Article`]: Tries to get list of eSport
+        articles. See :func:`get_articles`"""
+        if count < 1:
+            raise ValueError("Value of \"count\" parameter must be more than 0")
+
+        if page < 1:
+            raise ValueError("Value of \"page\" parameter must be more than 0")
+
+        articles, meta = await self._get_articles_page(count, page)
+        output: List[Article] = self._build("Article", lambda: [Article.from_json(a) for a in articles])
+        return ESportListResponse(output, page=page, last_page=meta["last_page"], per_page=count, total=meta["total"])
+
+    async def _get_articles_page(
+        self,
+        count: int,
+        page: int,
+        *,
+        cache: bool = True
+    ) -> Tuple[List[Mapping[str, Any]], Mapping[str, Any]]:
+        """Tuple[List[Mapping[:class:`str`, :class:`Any`]], Mapping[:class:`str`, :class:`Any`]]:
+        Returns JSON data of articles on the page and the meta of pagination"""
+        endpoint: str = f"/articles?count={count}&page={page}"
+        response: Mapping[str, Any] = await self.http.request("GET", endpoint, base="https://tankisport.com/api",
+                                                              cache=cache)
+        if not response.get("success", False):
+            raise self._fail(TankiOnlineException("Failed to get articles"))
+
+        return response["data"]["articles"], response["meta"]
+
+    async def iter_articles(
+        self,
+        *,
+        count: int = 20,
+        prefetch: int = 4,
+        start: int = 1
+    ) -> AsyncGenerator[Article, None]:
+        """:class:`Article`: Yields all the eSport articles in order, requesting
+        next pages in advance. See :func:`iter_articles`"""
+        if prefetch < 1:
+            raise ValueError("Value of \"prefetch\" parameter must be more than 0")
+
+        response: ESportListResponse[Article] = await self.get_articles(count=count, page=start)
+        pending: Deque["asyncio.Task[ESportListResponse[Article]]"] = deque()
+        scheduled: int = start
+        seen: Set[int] = set()
+        try:
+            while True:
+                while scheduled < response.last_page and len(pending) < prefetch:
+                    scheduled += 1
+                    pending.append(asyncio.ensure_future(self.get_articles(count=count, page=scheduled)))
+
+                for article in response.data:
+                    # new articles shift the pages, so the last ones of the page can be repeated on the next one
+                    if article.id not in seen:
+                        seen.add(article.id)
+                        yield article
+
+                if not pending:
+                    return
+
+                response = await pending.popleft()
+
+        finally:
+            # if the iteration is stopped early, then the prefetched pages must not leak
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def sync_articles(
+        self,
+        *,
+        since_id: Optional[int] = None,
+        since_date: Optional[dt] = None,
+        store: Optional[WatermarkStore] = None,
+        key: str = "articles",
+        count: int = 20,
+        max_pages: Optional[int] = None
+    ) -> List[Article]:
+        """List[:class:`Article`]: Returns only the eSport articles, which are new
+        or changed since the watermark. See :func:`sync_articles`"""
+        if count < 1:
+            raise ValueError("Value of \"count\" parameter must be more than 0")
+
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("Value of \"max_pages\" parameter must be more than 0")
+
+        watermark: Optional[Watermark] = None
+        if since_id is not None or since_date is not None:
+            watermark = Watermark(since_id, since_date)
+
+        elif store is not None:
+            watermark = await store.load(key)
+
+        previous: Watermark = watermark or Watermark()
+        current: Watermark = previous.copy()
+        found: Dict[int, Mapping[str, Any]] = {}
+        page: int = 1
+        complete: bool = False
+        while True:
+            # the cache would return the same pages for its TTL, so new articles would be missed
+            articles, meta = await self._get_articles_page(count, page, cache=False)
+            fresh: List[bool] = [previous.is_new(a) or previous.is_changed(a) for a in articles]
+            for data, changed in zip(articles, fresh):
+                # new articles shift the pages, so the last ones of the page can be repeated on the next one
+                if changed:
+                    found.setdefault(data["id"], data)
+
+                current.advance(data)
+
+            # pinned articles can be above new ones, so the watermark is reached only if the whole page is
+            # old or it ends with an old article
+            if not any(fresh) or not fresh[-1] or page >= meta["last_page"]:
+                complete = True
+                break
+
+            if max_pages is not None and page >= max_pages:
+                break
+
+            page += 1
+
+        # only new and changed articles are built
+        output: List[Article] = self._build("Article", lambda: [Article.from_json(a) for a in found.values()])
+
+        # if the walk is stopped by "max_pages" before the watermark, then the moved watermark would
+        # skip unread articles, so it's kept
+        if store is not None and complete and current != watermark:
+            await store.save(key, current)
+
+        return output
+
+    async def get_article_info(self, id: int) -> Article:
+        """:class:`Article`: Tries to get information about article with specified
+        ID. See :func:`get_article_info`"""
+        endpoint: str = f"/articles/show/{id}"
+        response: Mapping[str, Any] = await self.http.request("GET", endpoint, base="https://tankisport.com/api")
+        if not response.get("success", False):
+            raise self._fail(TankiOnlineException(f"Failed to get info about article with {id} id"))
+
+        return self._build("Article", Article.from_json, response["data"])
+
+    async def get_article_comments(self, article_id: int) -> List[ArticleComment]:
+        """List[:class:`ArticleComment`]: Tries to get comments of article with
+        specified ID. See :func:`get_article_comments`"""
+        endpoint: str = f"/comments?article_id={article_id}"
+        response: Mapping[str, Any] = await self.http.request("GET", endpoint, base="https://tankisport.com/api")
+        if not response.get("success", False):
+            raise self._fail(TankiOnlineException(f"Failed to get comments of article with {article_id} id"))
+
+        return self._build("ArticleComment", lambda: [ArticleComment.from_json(c) for c in response["data"]])
+
+
+_DEFAULT: Optional[Client] = None
+
+
+def _default() -> Client:
+    """:class:`Client`: Returns the client which is used by module-level
+    functions. It's created on the first call and shares the session with
+    :func:`toapi.http.request`"""
+    global _DEFAULT  # pylint: disable=W0603
+    if _DEFAULT is None:
+        _DEFAULT = Client.from_http(default_http())
+
+    return _DEFAULT
+
 
 async def get_tops() -> TopLists:
     """List[:class:`Top`]: Gets list with tops of players
@@ -25,11 +629,7 @@ async def get_tops() -> TopLists:
     ------
     :class:`TankiOnlineException`
         If the response from the API says that the operation wasn't successful"""
-    response: Mapping[str, Any] = await request("GET", "/top")
-    if response["responseType"] != "OK":
-        raise TankiOnlineException("Failed to get the tops")
-
-    return TopLists.from_json(response["response"])
+    return await _default().get_tops()
 
 
 async def get_user(name: str, *, lang: str = "en") -> User:
@@ -50,11 +650,72 @@ async def get_user(name: str, *, lang: str = "en") -> User:
         possible if a player with such a name doesn't exist, or he
         disables the ability to receive information about him through
         the API"""
-    response: Mapping[str, Any] = await request("GET", f"/profile?user={name}&lang={lang}")
-    if response["responseType"] == "NOT_FOUND":
-        raise UserNotFoundError(name, f"Failed to find player with \"{name}\" name")
+    return await _default().get_user(name, lang=lang)
+
+
+async def get_users(
+    names: Iterable[str],
+    *,
+    lang: str = "en",
+    concurrency: int = 10
+) -> List[Union[User, UserNotFoundError]]:
+    """List[Union[:class:`User`, :class:`UserNotFoundError`]]: Tries to find many
+    users at once, making at most :param:`concurrency` requests at the same time
+
+    Repeated names are requested only once. The output is in the same order as
+    :param:`names`; if some user isn't found, then its place is occupied by
+    :class:`UserNotFoundError` instead of raising it
+
+    Parameters
+    ----------
+    names: Iterable[:class:`str`]
+        The names of the users
+
+    lang: :class:`str`
+        The language of API responses. By default, `en`
+
+    concurrency: :class:`int`
+        The maximum count of simultaneous requests. Must be more than zero.
+        By default, `10`
+    
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`concurrency` less than or equal to zero (`0`)"""
+    return await _default().get_users(names, lang=lang, concurrency=concurrency)
+
+
+async def iter_users(
+    names: Iterable[str],
+    *,
+    lang: str = "en",
+    concurrency: int = 10
+) -> AsyncGenerator[Tuple[str, Union[User, UserNotFoundError]], None]:
+    """Tuple[:class:`str`, Union[:class:`User`, :class:`UserNotFoundError`]]: Tries
+    to find many users at once, like :func:`get_users`, but yields pairs of name
+    and result in order of completion
+
+    If the iteration is stopped early, then all unfinished requests are
+    cancelled
+
+    Parameters
+    ----------
+    names: Iterable[:class:`str`]
+        The names of the users
+
+    lang: :class:`str`
+        The language of API responses. By default, `en`
 
-    return User.from_json(response["response"])
+    concurrency: :class:`int`
+        The maximum count of simultaneous requests. Must be more than zero.
+        By default, `10`
+    
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`concurrency` less than or equal to zero (`0`)"""
+    async for item in _default().iter_users(names, lang=lang, concurrency=concurrency):
+        yield item
 
 
 async def get_status() -> StableServerStatus:
@@ -62,21 +723,71 @@ async def get_status() -> StableServerStatus:
     
     Maybe deprecated. I don't know this. Judging by the content of the
     response from the API, the chance of this is approximately `99%`"""
-    response: Mapping[str, Any] = await request("GET", "/status.js", base="https://tankionline.com/s")
-    return StableServerStatus.from_json(response)
+    return await _default().get_status()
 
 
-async def get_test_status() -> List[TestServerStatus]:
-    """List[:class:`TestServerStatus`]: Gets the status of test game servers"""
-    response: List[Mapping[str, Any]] = await request("GET", "/public_test", base="https://test.tankionline.com")
+async def get_test_status(*, concurrency: int = 10, timeout: Optional[float] = 5.0) -> List[TestServerStatus]:
+    """List[:class:`TestServerStatus`]: Gets the status of test game servers
 
-    output: List[TestServerStatus] = []
-    for server in response:
-        base: str = f"https://balancer.{server['Domain']}"
-        nodes: Mapping[str, Mapping[str, Any]] = (await request("GET", "/balancer", base=base))["nodes"]
-        output.append(TestServerStatus.from_json(server, nodes))
+    Nodes of the servers are requested from their balancers at the same time.
+    If some balancer fails or doesn't respond in :param:`timeout`, then its
+    server is still returned, but without nodes and with the error in
+    :attr:`TestServerStatus.error`
 
-    return output
+    Parameters
+    ----------
+    concurrency: :class:`int`
+        The maximum count of simultaneous requests to balancers. Must be more
+        than zero. By default, `10`
+
+    timeout: Optional[:class:`float`]
+        The time (in seconds) to wait for every balancer. If `None`, then it's
+        unlimited. By default, `5.0`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`concurrency` less than or equal to zero (`0`)"""
+    return await _default().get_test_status(concurrency=concurrency, timeout=timeout)
+
+
+async def watch_servers(
+    *,
+    interval: float = 30.0,
+    test: bool = True,
+    timeout: Optional[float] = 5.0
+) -> AsyncGenerator[List[NodeChange], None]:
+    """List[:class:`NodeChange`]: Polls the status of stable and test game
+    servers every :param:`interval` seconds and yields the list of changes of
+    their nodes only if something is changed: nodes are added or removed, or
+    their status or counts of players are changed. The first poll yields all
+    the nodes as added
+
+    Nodes are compared by their names. If the body of some response is the
+    same as at the previous poll, then it isn't even decoded. All the polls
+    reuse pooled connections of the client, if :param:`interval` is less than
+    their keep-alive timeout, and bypass its cache. If some request fails or
+    times out, then the nodes of its server are kept until the next
+    successful poll, so temporary errors don't stop the watching
+
+    Parameters
+    ----------
+    interval: :class:`float`
+        The time (in seconds) between starts of polls. By default, `30.0`
+
+    test: :class:`bool`
+        Whether to watch test servers too. By default, `True`
+
+    timeout: Optional[:class:`float`]
+        The timeout (in seconds) of every request of the poll. By default,
+        `5.0`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`interval` less than or equal to zero (`0`)"""
+    async for changes in _default().watch_servers(interval=interval, test=test, timeout=timeout):
+        yield changes
 
 
 async def get_articles(*, count: int = 20, page: int = 1) -> ESportListResponse[Article]:
@@ -97,20 +808,99 @@ async def get_articles(*, count: int = 20, page: int = 1) -> ESportListResponse[
         
     :class:`TankiOnlineException`
         If the response from the API says that the operation wasn't successful"""
-    if count < 1:
-        raise ValueError("Value of \"count\" parameter must be more than 0")
+    return await _default().get_articles(count=count, page=page)
+
 
-    if page < 1:
-        raise ValueError("Value of \"page\" parameter must be more than 0")
+async def iter_articles(*, count: int = 20, prefetch: int = 4, start: int = 1) -> AsyncGenerator[Article, None]:
+    """:class:`Article`: Yields all the eSport articles in order, from the first
+    page (or :param:`start` one) to the last
 
-    endpoint: str = f"/articles?count={count}&page={page}"
-    response: Mapping[str, Any] = await request("GET", endpoint, base="https://tankisport.com/api")
-    if not response.get("success", False):
-        raise TankiOnlineException("Failed to get articles")
+    The count of pages is known from the first response, so up to
+    :param:`prefetch` next pages are requested at the same time while the
+    current one is consumed. If the iteration is stopped early, then all
+    unfinished requests are cancelled. If articles are published during the
+    iteration, then the ones shifted to the next page aren't repeated
 
-    output: List[Article] = [Article.from_json(a) for a in response["data"]["articles"]]
-    meta: Mapping[str, Any] = response["meta"]
-    return ESportListResponse(output, page=page, last_page=meta["last_page"], per_page=count, total=meta["total"])
+    Parameters
+    ----------
+    count: :class:`int`
+        The number of articles per page. Must be more than zero. By default, `20`
+
+    prefetch: :class:`int`
+        The maximum count of pages requested in advance. Must be more than
+        zero. By default, `4`
+
+    start: :class:`int`
+        The number of the first page. Must be more than zero. By default, `1`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`count`, :param:`prefetch` or :param:`start` less than or
+        equal to zero (`0`)
+
+    :class:`TankiOnlineException`
+        If the response from the API says that the operation wasn't successful"""
+    async for article in _default().iter_articles(count=count, prefetch=prefetch, start=start):
+        yield article
+
+
+async def sync_articles(
+    *,
+    since_id: Optional[int] = None,
+    since_date: Optional[dt] = None,
+    store: Optional[WatermarkStore] = None,
+    key: str = "articles",
+    count: int = 20,
+    max_pages: Optional[int] = None
+) -> List[Article]:
+    """List[:class:`Article`]: Returns only the eSport articles, which are new
+    or changed since the watermark, newest first
+
+    Pages are walked only until the page, which has no new articles or ends
+    with an article at or below the watermark, so if nothing is published,
+    then only the first page is requested, and no article is built. Articles
+    pinned above new ones don't stop the walk. The article is new if its ID or date
+    is bigger than the watermark's one, and changed if it's older, but moved
+    above the newest seen article (see :attr:`Watermark.list_order`)
+
+    The watermark is taken from :param:`since_id` and :param:`since_date`, or,
+    if they aren't specified, from :param:`store`. If there is no watermark at
+    all, then all the articles are new. After the sync, the watermark is moved
+    to the newest seen article and saved to :param:`store`. If the walk is
+    stopped by :param:`max_pages` before the watermark, then it isn't moved,
+    so the next sync returns these articles again with the unread ones
+
+    Parameters
+    ----------
+    since_id: Optional[:class:`int`]
+        The ID of the last known article. By default, `None`
+
+    since_date: Optional[:class:`datetime`]
+        The date of the last known article. By default, `None`
+
+    store: Optional[:class:`WatermarkStore`]
+        The store of the watermark between syncs. By default, `None`
+
+    key: :class:`str`
+        The key of the watermark in :param:`store`. By default, `articles`
+
+    count: :class:`int`
+        The number of articles per page. Must be more than zero. By default, `20`
+
+    max_pages: Optional[:class:`int`]
+        The maximum count of walked pages. If `None`, then it's unlimited. By
+        default, `None`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If :param:`count` or :param:`max_pages` less than or equal to zero (`0`)
+
+    :class:`TankiOnlineException`
+        If the response from the API says that the operation wasn't successful"""
+    return await _default().sync_articles(since_id=since_id, since_date=since_date, store=store, key=key,
+                                          count=count, max_pages=max_pages)
 
 
 async def get_article_info(id: int) -> Article:
@@ -126,12 +916,7 @@ async def get_article_info(id: int) -> Article:
     ------
     :class:`TankiOnlineException`
         If the response from the API says that the operation wasn't successful"""
-    endpoint: str = f"/articles/show/{id}"
-    response: Mapping[str, Any] = await request("GET", endpoint, base="https://tankisport.com/api")
-    if not response.get("success", False):
-        raise TankiOnlineException(f"Failed to get info about article with {id} id")
-
-    return Article.from_json(response["data"])
+    return await _default().get_article_info(id)
 
 
 async def get_article_comments(article_id: int) -> List[ArticleComment]:
@@ -148,9 +933,4 @@ async def get_article_comments(article_id: int) -> List[ArticleComment]:
     ------
     :class:`TankiOnlineException`
         If the response from the API says that the operation wasn't successful"""
-    endpoint: str = f"/comments?article_id={article_id}"
-    response: Mapping[str, Any] = await request("GET", endpoint, base="https://tankisport.com/api")
-    if not response.get("success", False):
-        raise TankiOnlineException(f"Failed to get comments of article with {article_id} id")
-
-    return [ArticleComment.from_json(c) for c in response["data"]]
+    return await _default().get_article_comments(article_id)
@@ -0,0 +1,81 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import locale
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Final, Iterator, Optional, Tuple
+
+__all__ = ("LANGUAGES", "get_language", "set_language", "reset_language", "language")
+
+
+LANGUAGES: Final[Tuple[str, ...]] = ("en", "ru")
+
+
+def _detect() -> str:
+    """:class:`str`: Detects the language by the locale of the process. It's
+    called only once, on import"""
+    name: Optional[str] = locale.getlocale()[0]
+    return "ru" if name is not None and (name == "Russian_Russia" or name.startswith("ru_")) else "en"
+
+
+DEFAULT_LANGUAGE: Final[str] = _detect()
+_LANGUAGE: ContextVar[str] = ContextVar("toapi_language", default=DEFAULT_LANGUAGE)
+
+
+def get_language() -> str:
+    """:class:`str`: Returns the language of rank names and URLs in the current
+    context. By default, it's `ru`, if the locale of the process was Russian
+    on import, otherwise `en`"""
+    return _LANGUAGE.get()
+
+
+def set_language(lang: str) -> "Token[str]":
+    """Token[:class:`str`]: Sets the language in the current context (thread
+    or task) and returns the token to reset it (see :func:`reset_language`)
+
+    Parameters
+    ----------
+    lang: :class:`str`
+        The language: `en` or `ru`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If the language isn't supported"""
+    if lang not in LANGUAGES:
+        raise ValueError(f"Unsupported language \"{lang}\", must be one of: {', '.join(LANGUAGES)}")
+
+    return _LANGUAGE.set(lang)
+
+
+def reset_language(token: "Token[str]") -> None:
+    """Restores the language, which was before :func:`set_language`
+
+    Parameters
+    ----------
+    token: Token[:class:`str`]
+        The token returned by :func:`set_language`"""
+    _LANGUAGE.reset(token)
+
+
+@contextmanager
+def language(lang: str) -> Iterator[str]:
+    """The context manager, which sets the language only inside it. For
+    example, `with language("ru"): print(user.rank.name)`
+
+    Parameters
+    ----------
+    lang: :class:`str`
+        The language: `en` or `ru`"""
+    token: "Token[str]" = set_language(lang)
+    try:
+        yield lang
+
+    finally:
+        _LANGUAGE.reset(token)
@@ -6,8 +6,9 @@ The above copyright notice and this permission notice shall be included in all c
 
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
-import locale
-from typing import Final, List
+from typing import Dict, Final, List, Optional
+
+from .language import LANGUAGES, get_language
 
 __all__ = ("get_rank_name",)
 
@@ -28,15 +29,43 @@ LANG_RU: Final[List[str]] = ["новобранец", "рядовой", "ефре
                              "генералиссимус", "легенда"]
 
 
-def get_rank_name(rank: int) -> str:
+# the count of Legend ranks whose names are built in advance. Names of higher ranks are built on demand
+LEGENDS: Final[int] = 200
+
+
+def _build_names(names: List[str], count: int) -> List[str]:
+    """List[:class:`str`]: Builds names of ranks from `1` to `30+count`. The
+    first item is empty, so the name is found by the number of rank"""
+    return ["", *names[:30], *(f"{names[30]} {n}" for n in range(1, count+1))]
+
+
+LANG_NAMES: Final[Dict[str, List[str]]] = {"en": LANG_EN, "ru": LANG_RU}
+RANK_NAMES: Final[Dict[str, List[str]]] = {k: _build_names(v, LEGENDS) for k, v in LANG_NAMES.items()}
+
+
+def get_rank_name(rank: int, lang: Optional[str] = None) -> str:
     """:class:`str`: Gets the name of player's rank
     
     Parameters
     ----------
     rank: :class:`int`
-        The number of player's rank"""
-    index: int = min(rank-1, 30)
-    if locale.getlocale()[0] == "Russian_Russia":
-        return LANG_RU[index] + ("" if index < 30 else f" {rank-30}")
+        The number of player's rank
+
+    lang: Optional[:class:`str`]
+        The language of the name: `en` or `ru`. If `None`, then the language
+        of the current context is used (see :func:`get_language`). By default,
+        `None`
+
+    Raises
+    ------
+    :class:`ValueError`
+        If the language isn't supported"""
+    lang = lang or get_language()
+    if lang not in LANGUAGES:
+        raise ValueError(f"Unsupported language \"{lang}\", must be one of: {', '.join(LANGUAGES)}")
+
+    names: List[str] = RANK_NAMES[lang]
+    if rank >= len(names):
+        return f"{LANG_NAMES[lang][30]} {rank-30}"
 
-    return LANG_EN[index] + ("" if index < 30 else f" {rank-30}")
+    return names[max(rank, 1)]
@@ -0,0 +1,73 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import json
+from typing import Any, Callable, Dict, Final, Optional, Tuple
+
+__all__ = ("JSONDecoder", "available_decoders", "get_decoder")
+
+JSONDecoder = Callable[[bytes], Any]
+PREFERENCE: Final[Tuple[str, ...]] = ("orjson", "msgspec", "ujson", "json")
+
+_DECODERS: Dict[str, JSONDecoder] = {}
+
+try:
+    import orjson
+
+    _DECODERS["orjson"] = orjson.loads  # pylint: disable=E1101
+
+except ModuleNotFoundError:
+    pass
+
+try:
+    import msgspec
+
+    _DECODERS["msgspec"] = msgspec.json.Decoder().decode
+
+except ModuleNotFoundError:
+    pass
+
+try:
+    import ujson
+
+    _DECODERS["ujson"] = ujson.loads
+
+except ModuleNotFoundError:
+    pass
+
+_DECODERS["json"] = json.loads
+
+
+def available_decoders() -> Tuple[str, ...]:
+    """Tuple[:class:`str`, ...]: Gets names of installed JSON backends, from the
+    fastest to the slowest"""
+    return tuple(n for n in PREFERENCE if n in _DECODERS)
+
+
+def get_decoder(name: Optional[str] = None) -> Tuple[str, JSONDecoder]:
+    """Tuple[:class:`str`, Callable[[:class:`bytes`], :class:`Any`]]: Gets the
+    name and the function of JSON backend which decodes response bytes directly,
+    without decoding them to :class:`str` first
+    
+    Parameters
+    ----------
+    name: Optional[:class:`str`]
+        The name of the backend: `orjson`, `msgspec`, `ujson` or `json`. If
+        `None`, then the fastest installed one is used. By default, `None`
+    
+    Raises
+    ------
+    :class:`ValueError`
+        If the backend with specified :param:`name` isn't installed"""
+    if name is None:
+        name = available_decoders()[0]
+
+    if name not in _DECODERS:
+        raise ValueError(f"JSON backend \"{name}\" isn't installed")
+
+    return name, _DECODERS[name]
@@ -6,7 +6,10 @@ The above copyright notice and this permission notice shall be included in all c
 
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
-__all__ = ("TankiOnlineException", "UserNotFoundError")
+from typing import Optional
+
+__all__ = ("TankiOnlineException", "UserNotFoundError", "HTTPException", "CircuitOpenError",
+           "PayloadTooLargeError")
 
 
 class TankiOnlineException(Exception):
@@ -25,3 +28,61 @@ class UserNotFoundError(TankiOnlineException):
     def __init__(self, username: str, *args: object) -> None:
         self.username: str = username
         super().__init__(*args)
+
+
+class HTTPException(TankiOnlineException):
+    """The class for errors when the API responds with throttling or server
+    error status (`429` or `5xx`)
+    
+    Attributes
+    ----------
+    status: :class:`int`
+        The HTTP status of the response
+        
+    url: :class:`str`
+        The URL of the request
+        
+    retry_after: Optional[:class:`float`]
+        The time (in seconds) after which the API asks to repeat the request.
+        If the API doesn't specify it, then it's `None`"""
+
+    def __init__(self, status: int, url: str, *args: object, retry_after: Optional[float] = None) -> None:
+        self.status: int = status
+        self.url: str = url
+        self.retry_after: Optional[float] = retry_after
+        super().__init__(*args)
+
+
+class CircuitOpenError(TankiOnlineException):
+    """The class for errors when requests to the host are temporarily blocked,
+    because it fails too often (see :class:`CircuitBreaker`)
+    
+    Attributes
+    ----------
+    host: :class:`str`
+        The hostname whose circuit is open
+        
+    retry_after: :class:`float`
+        The time (in seconds) after which the host will be tried again"""
+
+    def __init__(self, host: str, retry_after: float, *args: object) -> None:
+        self.host: str = host
+        self.retry_after: float = retry_after
+        super().__init__(*args)
+
+
+class PayloadTooLargeError(TankiOnlineException):
+    """The class for errors when the response body is bigger than allowed
+    
+    Attributes
+    ----------
+    url: :class:`str`
+        The URL of the request
+        
+    limit: :class:`int`
+        The maximum allowed size (in bytes) of the body"""
+
+    def __init__(self, url: str, limit: int, *args: object) -> None:
+        self.url: str = url
+        self.limit: int = limit
+        super().__init__(*args)
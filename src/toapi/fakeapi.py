@@ -0,0 +1,349 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import argparse
+import asyncio
+import random
+from datetime import datetime as dt, timedelta as td
+from typing import Any, Awaitable, Callable, Dict, Final, Iterable, List, Optional, Set
+
+from aiohttp import web
+
+__all__ = ("FakeAPI",)
+
+
+HULLS: Final[List[str]] = ["Wasp", "Hornet", "Hopper", "Viking", "Hunter", "Crusader", "Dictator", "Paladin", "Titan",
+                           "Ares", "Mammoth", "Juggernaut"]
+TURRETS: Final[List[str]] = ["Firebird", "Freeze", "Isida", "Tesla", "Hammer", "Twins", "Ricochet", "Smoky", "Striker",
+                             "Vulcan", "Thunder", "Scorpion", "Railgun", "Magnum", "Gauss", "Shaft", "Terminator"]
+PAINTS: Final[List[str]] = ["Green", "Holiday", "Desert", "Swamp", "Urban", "Forester", "Zeus", "Inferno", "Lead",
+                            "Rustle", "Dragon", "Emerald"]
+DRONES: Final[List[str]] = ["Brutus", "Trickster", "Crisis", "Mechanic", "Defender", "Saboteur", "Blaster"]
+MODES: Final[List[str]] = ["DM", "TDM", "CTF", "CP", "AS", "RGB", "JGR", "SGE", "TJR"]
+SUPPLIES: Final[List[str]] = ["Repair Kit", "Double Armor", "Double Damage", "Speed Boost", "Mine", "Gold box",
+                              "Overdrive"]
+TOPS: Final[List[str]] = ["crystals", "efficiency", "golds", "score"]
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeAPI:
+    """The local stand-in server of Tanki Online's API for offline benchmarks
+    and load tests. It serves realistic responses of all endpoints used by
+    the library, generated deterministically from the request
+
+    The server keeps paths of the real API, so the client is pointed to it by
+    :class:`toapi.AiohttpTransport` with `origin` option::
+
+        async with FakeAPI(latency=0.05) as api:
+            async with toapi.Client(transport=toapi.AiohttpTransport(origin=api.origin)) as client:
+                user = await client.get_user("sty")
+
+    It can also be run as separate process: `python -m toapi.fakeapi --port 8080`
+    
+    Parameters
+    ----------
+    host: :class:`str`
+        The host to listen on. By default, `127.0.0.1`
+        
+    port: :class:`int`
+        The port to listen on. If `0`, then a free port is chosen. By default,
+        `0`
+        
+    latency: :class:`float`
+        The delay (in seconds) before every response. By default, `0.0`
+        
+    jitter: :class:`float`
+        The maximum random delay (in seconds) added to :param:`latency`. By
+        default, `0.0`
+        
+    error_rate: :class:`float`
+        The part (from `0` to `1`) of requests that are answered with `503`
+        status. By default, `0.0`
+        
+    missing: Iterable[:class:`str`]
+        The names of users that aren't found. By default, there are no such
+        users
+        
+    articles: :class:`int`
+        The total count of articles. By default, `100`
+        
+    image_size: :class:`int`
+        The size (in bytes) of every image. By default, `16384`
+        
+    seed: Optional[:class:`int`]
+        The seed for random latency and errors. By default, `None`
+    
+    Attributes
+    ----------
+    requests: :class:`int`
+        The count of received requests"""
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        missing: Iterable[str] = (),
+        articles: int = 100,
+        image_size: int = 16384,
+        seed: Optional[int] = None
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.missing: Set[str] = set(missing)
+        self.articles: int = articles
+        self.image_size: int = image_size
+        self.requests: int = 0
+
+        self._random: random.Random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(origin={self.origin!r}, latency={self.latency})"
+
+    async def __aenter__(self) -> "FakeAPI":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def origin(self) -> str:
+        """:class:`str`: The origin of the server. For example,
+        `http://127.0.0.1:8080`"""
+        return f"http://{self.host}:{self.port}"
+
+    def make_app(self) -> web.Application:
+        """:class:`aiohttp.web.Application`: Creates the application with all
+        routes of the server"""
+        app: web.Application = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/eu/profile", self._profile)
+        app.router.add_get("/api/eu/top", self._top)
+        app.router.add_get("/s/status.js", self._status)
+        app.router.add_get("/public_test", self._public_test)
+        app.router.add_get("/balancer", self._balancer)
+        app.router.add_get("/api/articles", self._articles)
+        app.router.add_get("/api/articles/show/{id}", self._article)
+        app.router.add_get("/api/comments", self._comments)
+        app.router.add_get("/images/{name}", self._image)
+        return app
+
+    async def start(self) -> str:
+        """:class:`str`: Starts the server and returns its origin"""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site: web.TCPSite = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+
+        return self.origin
+
+    async def close(self) -> None:
+        """Stops the server"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        self.requests += 1
+        delay: float = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.Response(status=503, text="Service Unavailable", headers={"Retry-After": "1"})
+
+        return await handler(request)
+
+    def _image_url(self, name: str) -> str:
+        return f"https://s.eu.tankionline.com/images/{name.lower().replace(' ', '_')}.tnk"
+
+    def _game_objects(self, rng: random.Random, names: List[str], graded: bool) -> List[Dict[str, Any]]:
+        output: List[Dict[str, Any]] = []
+        for index, name in enumerate(rng.sample(names, rng.randint(1, len(names)))):
+            grade: int = rng.randint(0, 3) if graded else -1
+            output.append({"grade": grade, "id": 1000*(names.index(name)+1) + max(grade, 0),
+                           "imageUrl": self._image_url(name), "name": name + (f" M{grade}" if graded else ""),
+                           "properties": None, "scoreEarned": rng.randint(0, 10**6) // (index+1),
+                           "timePlayed": rng.randint(0, 10**6)})
+
+        return output
+
+    def _rating(self, rng: random.Random) -> Dict[str, Any]:
+        return {top: None if rng.random() < 0.3 else {"position": rng.randint(1, 10**5),
+                                                      "value": rng.randint(0, 10**7)} for top in TOPS}
+
+    def make_profile(self, name: str) -> Dict[str, Any]:
+        """Dict[:class:`str`, :class:`Any`]: Generates the profile of the user
+        
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the user. The same name always gives the same profile"""
+        rng: random.Random = random.Random(name)
+        rank: int = rng.randint(1, 40)
+        score: int = rng.randint(0, 10**7)
+        return {
+            "name": name, "rank": rank, "hasPremium": rng.random() < 0.3,
+            "kills": rng.randint(0, 10**6), "deaths": rng.randint(1, 10**6), "caughtGolds": rng.randint(0, 10**4),
+            "earnedCrystals": rng.randint(0, 10**7), "gearScore": rng.randint(0, 10**4),
+            "score": score, "scoreBase": max(score-rng.randint(0, 10**5), 0), "scoreNext": score+rng.randint(1, 10**5),
+            "hullsPlayed": self._game_objects(rng, HULLS, True),
+            "turretsPlayed": self._game_objects(rng, TURRETS, True),
+            "paintsPlayed": self._game_objects(rng, PAINTS, False),
+            "dronesPlayed": self._game_objects(rng, DRONES, False),
+            "resistanceModules": self._game_objects(rng, PAINTS, False),
+            "modesPlayed": [{"name": m, "type": m, "scoreEarned": rng.randint(0, 10**6),
+                             "timePlayed": rng.randint(0, 10**6)}
+                            for m in rng.sample(MODES, rng.randint(1, len(MODES)))],
+            "suppliesUsage": [{"id": i, "imageUrl": self._image_url(s), "name": s, "usages": rng.randint(0, 10**5)}
+                              for i, s in enumerate(SUPPLIES)],
+            "mounted": {"armor": self._image_url(HULLS[0]), "paint": self._image_url(PAINTS[0]),
+                        "weapon": self._image_url(TURRETS[0])},
+            "presents": [],
+            "rating": self._rating(rng),
+            "previousRating": self._rating(rng)
+        }
+
+    def make_tops(self, size: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """Dict[:class:`str`, List[Dict[:class:`str`, :class:`Any`]]]: Generates
+        the tops of players
+        
+        Parameters
+        ----------
+        size: :class:`int`
+            The count of players in every top. By default, `100`"""
+        rng: random.Random = random.Random("top")
+        return {top: [{"uid": f"player{rng.randint(1, 5*size)}", "rank": rng.randint(20, 40),
+                       "hasPremium": rng.random() < 0.5, "value": 10**6 - i*1000} for i in range(size)]
+                for top in TOPS}
+
+    def make_article(self, id: int, *, full: bool = False) -> Dict[str, Any]:
+        """Dict[:class:`str`, :class:`Any`]: Generates the article. Newer articles
+        have bigger ID
+        
+        Parameters
+        ----------
+        id: :class:`int`
+            The ID of the article
+            
+        full: :class:`bool`
+            Whether to include content and comments, like `/articles/show`
+            endpoint does. By default, `False`"""
+        rng: random.Random = random.Random(id)
+        category: Dict[str, Any] = {"id": id % 5 + 1, "category": f"Category {id % 5 + 1}", "lang": "EN"}
+        date: dt = dt(2020, 1, 1) + td(hours=12*id)
+        return {
+            "id": id, "author_id": id % 7 + 1, "author_username": f"author{id % 7 + 1}", "views": rng.randint(0, 10**5),
+            "category": [category], "categories": [category], "title": f"<p>Article #{id}</p>",
+            "short_desc": f"<p>Short description of article #{id}</p>",
+            "image": f"https://tankisport.com/images/article{id}.png", "wide_image": None, "status": 1, "type": 1,
+            "date": date.strftime("%Y-%m-%d %H:%M:%S"), "list_order": id,
+            "content": "<p>" + "Lorem ipsum dolor sit amet. "*rng.randint(10, 200) + "</p>" if full else None,
+            "comments": self.make_comments(id) if full else None
+        }
+
+    def make_comments(self, article_id: int) -> List[Dict[str, Any]]:
+        """List[Dict[:class:`str`, :class:`Any`]]: Generates comments of the article
+        
+        Parameters
+        ----------
+        article_id: :class:`int`
+            The ID of the article"""
+        rng: random.Random = random.Random(-article_id)
+        return [{"id": article_id*100+i, "commentable_type": "article", "commentable_id": article_id,
+                 "parent_id": None, "comment": f"<p>Comment #{i}</p>", "is_approved": 1,
+                 "user_id": rng.randint(1, 10**4), "created_at": "2023-05-18 12:00:00", "updated_at": None}
+                for i in range(rng.randint(0, 20))]
+
+    def make_nodes(self, seed: str) -> Dict[str, Dict[str, Any]]:
+        """Dict[:class:`str`, Dict[:class:`str`, :class:`Any`]]: Generates nodes of
+        the server
+        
+        Parameters
+        ----------
+        seed: :class:`str`
+            The seed of the nodes. For example, domain of the server"""
+        rng: random.Random = random.Random(seed)
+        return {f"c{i}": {"endpoint": {"host": f"c{i}.{seed}", "status": "OK" if rng.random() < 0.95 else "DOWN",
+                                       "tcpPorts": [5190, 15050], "wsPorts": [8080]},
+                          "inbattles": rng.randint(0, 1000), "online": rng.randint(0, 2000), "partners": {}}
+                for i in range(1, rng.randint(2, 9))}
+
+    async def _profile(self, request: web.Request) -> web.Response:
+        name: str = request.query.get("user", "")
+        if not name or name in self.missing:
+            return web.json_response({"responseType": "NOT_FOUND", "response": None})
+
+        return web.json_response({"responseType": "OK", "response": self.make_profile(name)})
+
+    async def _top(self, request: web.Request) -> web.Response:  # pylint: disable=W0613
+        return web.json_response({"responseType": "OK", "response": self.make_tops()})
+
+    async def _status(self, request: web.Request) -> web.Response:  # pylint: disable=W0613
+        return web.json_response({"linkForDownloadAPK": "", "minSupportedAndroidVersion": 5,
+                                  "maxSupportedAndroidVersion": 14, "nodes": self.make_nodes("eu.tankionline.com")})
+
+    async def _public_test(self, request: web.Request) -> web.Response:  # pylint: disable=W0613
+        return web.json_response([{"Release": f"deploy{i}-pubto", "Domain": f"public-deploy{i}.test-eu.tankionline.com",
+                                   "UserCount": i*10} for i in (1, 4, 6)])
+
+    async def _balancer(self, request: web.Request) -> web.Response:
+        # with the rewritten origin, the host of the test server is only in the forwarded header
+        return web.json_response({"nodes": self.make_nodes(request.headers.get("X-Forwarded-Host", request.host))})
+
+    async def _articles(self, request: web.Request) -> web.Response:
+        count: int = int(request.query.get("count", 20))
+        page: int = int(request.query.get("page", 1))
+        ids: List[int] = list(range(self.articles - (page-1)*count, max(self.articles - page*count, 0), -1))
+        return web.json_response({"success": True, "data": {"articles": [self.make_article(i) for i in ids]},
+                                  "meta": {"last_page": max((self.articles+count-1) // count, 1),
+                                           "total": self.articles}})
+
+    async def _article(self, request: web.Request) -> web.Response:
+        id: int = int(request.match_info["id"])
+        if not 0 < id <= self.articles:
+            return web.json_response({"success": False}, status=404)
+
+        return web.json_response({"success": True, "data": self.make_article(id, full=True)})
+
+    async def _comments(self, request: web.Request) -> web.Response:
+        return web.json_response({"success": True, "data": self.make_comments(int(request.query["article_id"]))})
+
+    async def _image(self, request: web.Request) -> web.Response:  # pylint: disable=W0613
+        return web.Response(body=b"\x89PNG" + bytes(self.image_size-4), content_type="image/png")
+
+
+def main() -> None:
+    """Runs the server from command line"""
+    parser = argparse.ArgumentParser(prog="python -m toapi.fakeapi",
+                                     description="The local stand-in server of Tanki Online's API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--articles", type=int, default=100)
+    args = parser.parse_args()
+
+    api: FakeAPI = FakeAPI(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           articles=args.articles)
+    web.run_app(api.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
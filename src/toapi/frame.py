@@ -0,0 +1,313 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+from array import array
+from typing import Any, Callable, Dict, Final, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+from .types import Rating, User
+
+# the module is typed as Any, so its optional import doesn't need narrowing in every method
+np: Any
+try:
+    import numpy as np
+
+except ModuleNotFoundError:
+    np = None
+
+__all__ = ("UserFrame",)
+
+RATINGS: Final[Tuple[str, ...]] = ("crystals", "efficiency", "golds", "score")
+COLUMNS: Final[Tuple[str, ...]] = ("rank", "kills", "deaths", "caught_golds", "crystals", "gear_score", "score",
+                                   *(f"{r}_{k}" for r in RATINGS for k in ("position", "value")))
+AGGREGATES: Final[Tuple[str, ...]] = ("count", "sum", "mean", "min", "max")
+
+
+class UserFrame:
+    """The columnar table of many users, where every statistic is stored as
+    one array, so it can be computed, filtered and sorted at once without
+    Python loop over the users
+
+    If :mod:`numpy` is installed, then columns are :class:`numpy.ndarray` and
+    all the operations are vectorized. Otherwise, they are :class:`array.array`
+    and operations are plain loops, which are still much more compact than
+    lists of :class:`User`
+
+    Columns are `rank`, `kills`, `deaths`, `caught_golds`, `crystals`,
+    `gear_score`, `score` and `<top>_position`/`<top>_value` of the current
+    rating in every top (`crystals`, `efficiency`, `golds` and `score`). If
+    the player isn't in some top, then its position and value are `-1`.
+    Computed `kd_ratio` column can be used everywhere where column name is
+    expected
+
+    Parameters
+    ----------
+    names: Sequence[:class:`str`]
+        The names of the users. They're stored as :class:`numpy.ndarray`, if
+        :mod:`numpy` is used, otherwise as :class:`list`
+
+    columns: Mapping[:class:`str`, Sequence[:class:`int`]]
+        The mapping where key is column name and value is its values. All
+        the columns must be specified
+
+    numpy: Optional[:class:`bool`]
+        Whether to use :mod:`numpy`. If `None`, then it's used if installed.
+        By default, `None`
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If :param:`numpy` is `True`, but :mod:`numpy` isn't installed
+
+    :class:`ValueError`
+        If some column is missing or lengths of columns are different"""
+
+    __slots__ = ("names", "numpy", "_columns")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        columns: Mapping[str, Sequence[int]],
+        *,
+        numpy: Optional[bool] = None
+    ) -> None:
+        if numpy and np is None:
+            raise RuntimeError("\"numpy\" requires numpy to be installed")
+
+        missing: List[str] = [c for c in COLUMNS if c not in columns]
+        if missing:
+            raise ValueError(f"Columns are missing: {', '.join(missing)}")
+
+        if any(len(columns[c]) != len(names) for c in COLUMNS):
+            raise ValueError("All the columns must have the same length as names")
+
+        self.numpy: bool = np is not None if numpy is None else numpy
+        self.names: Any = np.array(names, dtype=object) if self.numpy else list(names)
+        self._columns: Dict[str, Any] = {c: np.asarray(columns[c], dtype=np.int64) if self.numpy
+                                         else array("q", columns[c]) for c in COLUMNS}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(users={len(self)}, numpy={self.numpy})"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, column: str) -> Any:
+        if column == "kd_ratio":
+            return self.kd_ratio
+
+        try:
+            return self._columns[column]
+
+        except KeyError:
+            raise KeyError(f"There is no \"{column}\" column") from None
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Tuple[:class:`str`, ...]: The names of all the stored columns"""
+        return COLUMNS
+
+    @property
+    def kd_ratio(self) -> Any:
+        """Array[:class:`float`]: Kill/death ratio of every user. If the user has
+        no deaths, then it's equal to count of kills"""
+        kills, deaths = self._columns["kills"], self._columns["deaths"]
+        if self.numpy:
+            return kills/np.maximum(deaths, 1)
+
+        return array("d", (k/max(d, 1) for k, d in zip(kills, deaths)))
+
+    @classmethod
+    def from_users(cls: Type["UserFrame"], users: Iterable[User], *, numpy: Optional[bool] = None) -> "UserFrame":
+        """:class:`UserFrame`: Builds the table from the users. Lazy users (see
+        :meth:`User.from_json`) build only their ratings
+
+        Parameters
+        ----------
+        users: Iterable[:class:`User`]
+            The users
+
+        numpy: Optional[:class:`bool`]
+            Whether to use :mod:`numpy`. By default, `None`"""
+        names: List[str] = []
+        columns: Dict[str, List[int]] = {c: [] for c in COLUMNS}
+        appenders: List[Callable[[int], None]] = [columns[c].append for c in COLUMNS[:7]]
+        for user in users:
+            names.append(user.name)
+            for append, value in zip(appenders, (user.rank.number, user.kills, user.deaths, user.caught_golds,
+                                                 user.crystals, user.gear_score, user.score)):
+                append(value)
+
+            for top in RATINGS:
+                rating: Optional[Rating] = getattr(user.rating, top)
+                columns[f"{top}_position"].append(-1 if rating is None else rating.position)
+                columns[f"{top}_value"].append(-1 if rating is None else rating.value)
+
+        return cls(names, columns, numpy=numpy)
+
+    @classmethod
+    def from_json(
+        cls: Type["UserFrame"],
+        data: Iterable[Mapping[str, Any]],
+        *,
+        numpy: Optional[bool] = None
+    ) -> "UserFrame":
+        """:class:`UserFrame`: Builds the table straight from JSON data of
+        profiles (`response` of `/profile`), without building :class:`User`
+
+        Parameters
+        ----------
+        data: Iterable[Mapping[:class:`str`, :class:`Any`]]
+            The JSON data of profiles
+
+        numpy: Optional[:class:`bool`]
+            Whether to use :mod:`numpy`. By default, `None`"""
+        names: List[str] = []
+        columns: Dict[str, List[int]] = {c: [] for c in COLUMNS}
+        keys: Tuple[Tuple[List[int], str], ...] = tuple(zip(
+            (columns[c] for c in COLUMNS[:7]),
+            ("rank", "kills", "deaths", "caughtGolds", "earnedCrystals", "gearScore", "score")))
+        for profile in data:
+            names.append(profile["name"])
+            for column, key in keys:
+                column.append(profile[key])
+
+            ratings: Mapping[str, Any] = profile["rating"]
+            for top in RATINGS:
+                rating: Optional[Mapping[str, int]] = ratings[top]
+                columns[f"{top}_position"].append(-1 if rating is None else rating["position"])
+                columns[f"{top}_value"].append(-1 if rating is None else rating["value"])
+
+        return cls(names, columns, numpy=numpy)
+
+    @classmethod
+    def _from_columns(cls: Type["UserFrame"], names: Any, columns: Dict[str, Any], numpy: bool) -> "UserFrame":
+        """:class:`UserFrame`: Creates the table from already converted columns
+        without checks and copying"""
+        self = cls.__new__(cls)
+        self.numpy = numpy
+        self.names = names
+        self._columns = columns
+        return self
+
+    def _take(self, indexes: Any) -> "UserFrame":
+        """:class:`UserFrame`: Returns the table with rows by the indexes (or
+        the boolean mask, if :mod:`numpy` is used)"""
+        if self.numpy:
+            return self._from_columns(self.names[indexes], {c: v[indexes] for c, v in self._columns.items()}, True)
+
+        return self._from_columns([self.names[i] for i in indexes],
+                                  {c: array(v.typecode, (v[i] for i in indexes)) for c, v in self._columns.items()},
+                                  False)
+
+    def filter(self, mask: Sequence[bool]) -> "UserFrame":
+        """:class:`UserFrame`: Returns the table only with the users, whose
+        values of mask are `True`. For example,
+        `frame.filter(frame["rank"] >= 31)`
+
+        Parameters
+        ----------
+        mask: Sequence[:class:`bool`]
+            The value for every user
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the length of mask isn't equal to count of users"""
+        if len(mask) != len(self):
+            raise ValueError("The length of mask must be equal to count of users")
+
+        if self.numpy:
+            return self._take(np.asarray(mask, dtype=bool))
+
+        return self._take([i for i, keep in enumerate(mask) if keep])
+
+    def sort(self, column: str, *, reverse: bool = False) -> "UserFrame":
+        """:class:`UserFrame`: Returns the table sorted by the column. The sort is
+        stable
+
+        Parameters
+        ----------
+        column: :class:`str`
+            The name of the column
+
+        reverse: :class:`bool`
+            Whether to sort in descending order. By default, `False`"""
+        values: Any = self[column]
+        if self.numpy:
+            # negation keeps the sort stable in descending order too
+            return self._take(np.argsort(-values if reverse else values, kind="stable"))
+
+        return self._take(sorted(range(len(self)), key=values.__getitem__, reverse=reverse))
+
+    def head(self, count: int = 10) -> "UserFrame":
+        """:class:`UserFrame`: Returns the table with first users
+
+        Parameters
+        ----------
+        count: :class:`int`
+            The count of users. By default, `10`"""
+        return self._take(slice(0, count) if self.numpy else range(min(count, len(self))))
+
+    def group_by_rank(self, column: str, aggregate: str = "mean") -> Dict[int, float]:
+        """Dict[:class:`int`, :class:`float`]: Aggregates values of the column
+        for every rank. For example, `frame.group_by_rank("kd_ratio")`
+
+        Parameters
+        ----------
+        column: :class:`str`
+            The name of the column
+
+        aggregate: :class:`str`
+            The aggregate function: `count`, `sum`, `mean`, `min` or `max`. By
+            default, `mean`
+
+        Raises
+        ------
+        :class:`ValueError`
+            If the aggregate function is unknown"""
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate \"{aggregate}\", must be one of: {', '.join(AGGREGATES)}")
+
+        values: Any = self[column]
+        if self.numpy:
+            if len(self) == 0:
+                return {}
+
+            ranks: Any = self._columns["rank"]
+            counts: Any = np.bincount(ranks)
+            present: Any = np.flatnonzero(counts)
+            if aggregate in ("min", "max"):
+                # ranks are small, so their 16-bit keys are sorted by radix sort in linear time
+                keys: Any = ranks.astype(np.uint16) if ranks.max() <= 0xFFFF else ranks
+                starts: Any = np.concatenate(([0], np.cumsum(counts[present])[:-1]))
+                function: Any = np.minimum if aggregate == "min" else np.maximum
+                output: Any = function.reduceat(values[np.argsort(keys, kind="stable")], starts)
+
+            elif aggregate == "count":
+                output = counts[present]
+
+            else:
+                output = np.bincount(ranks, weights=values)[present]
+                if aggregate == "mean":
+                    output = output/counts[present]
+
+            return dict(zip(present.tolist(), output.tolist()))
+
+        groups: Dict[int, List[float]] = {}
+        for rank, value in zip(self._columns["rank"], values):
+            groups.setdefault(rank, []).append(value)
+
+        functions: Dict[str, Callable[[List[float]], float]] = {"count": len, "sum": sum, "min": min, "max": max,
+                                                                "mean": lambda v: sum(v)/len(v)}
+        return {r: functions[aggregate](groups[r]) for r in sorted(groups)}
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """List[Dict[:class:`str`, :class:`Any`]]: Returns the rows of this table
+        as dictionaries with `name` and all the columns"""
+        columns: List[List[int]] = [self._columns[c].tolist() for c in COLUMNS]
+        return [dict(zip(("name", *COLUMNS), row)) for row in zip(list(self.names), *columns)]
@@ -0,0 +1,238 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Final, List, Optional, Tuple
+
+__all__ = ("Hooks", "RequestTrace", "current_trace")
+
+EVENTS: Final[Tuple[str, ...]] = ("on_request_start", "on_response_headers", "on_body_done", "on_decoded",
+                                  "on_model_built", "on_error")
+Hook = Callable[["RequestTrace"], None]
+
+_CURRENT: ContextVar[Optional["RequestTrace"]] = ContextVar("toapi_trace", default=None)
+
+
+class RequestTrace:
+    """The timings of one request, which are filled while the request goes
+    on and passed to every hook. All times are in seconds; if some stage
+    isn't reached (yet), then its time is `None`
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The method of the request. For example, `GET`
+
+    url: :class:`str`
+        The full URL of the request
+
+    endpoint: :class:`str`
+        The name of the endpoint, which is the path of URL without the query.
+        For example, `/profile`
+
+    started: :class:`float`
+        The value of :func:`time.perf_counter` when the request was started
+
+    attempt: :class:`int`
+        The number of current attempt. It's more than `1` only if the request
+        is repeated by :class:`RetryPolicy`
+
+    status: Optional[:class:`int`]
+        The HTTP status of the response
+
+    size: Optional[:class:`int`]
+        The size (in bytes) of the body
+
+    dns_time: Optional[:class:`float`]
+        The time of resolving the host. It's `None` if the resolved address
+        was taken from the cache
+
+    connect_time: Optional[:class:`float`]
+        The time of opening the connection. It's `None` if the pooled
+        connection was reused
+
+    headers_time: Optional[:class:`float`]
+        The time from the start of the attempt to receiving the headers of
+        response. It includes :attr:`dns_time` and :attr:`connect_time`
+
+    body_time: Optional[:class:`float`]
+        The time of reading the body after the headers
+
+    decode_time: Optional[:class:`float`]
+        The time of decoding JSON of the body
+
+    build_time: Optional[:class:`float`]
+        The time of building the model (see :attr:`model`) from the decoded
+        response. With direct decoding, it includes decoding of the body
+
+    model: Optional[:class:`str`]
+        The name of built model's class. For example, `User`
+
+    cached: :class:`bool`
+        Whether the response was taken from :class:`ResponseCache` or from the
+        identical request in flight, so only `on_model_built` is emitted
+
+    error: Optional[:class:`BaseException`]
+        The error of the last attempt"""
+
+    __slots__ = ("method", "url", "endpoint", "started", "attempt", "status", "size", "dns_time", "connect_time",
+                 "headers_time", "body_time", "decode_time", "build_time", "model", "cached", "error", "_mark")
+
+    def __init__(self, method: str, url: str, endpoint: str) -> None:
+        self.method: str = method
+        self.url: str = url
+        self.endpoint: str = endpoint
+        self.started: float = time.perf_counter()
+        self.attempt: int = 0
+        self.status: Optional[int] = None
+        self.size: Optional[int] = None
+        self.dns_time: Optional[float] = None
+        self.connect_time: Optional[float] = None
+        self.headers_time: Optional[float] = None
+        self.body_time: Optional[float] = None
+        self.decode_time: Optional[float] = None
+        self.build_time: Optional[float] = None
+        self.model: Optional[str] = None
+        self.cached: bool = False
+        self.error: Optional[BaseException] = None
+        self._mark: float = self.started
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(method={self.method!r}, url={self.url!r}, status={self.status})"
+
+    @property
+    def elapsed(self) -> float:
+        """:class:`float`: The time since the start of the request"""
+        return time.perf_counter()-self.started
+
+    def lap(self) -> float:
+        """:class:`float`: Returns the time since the previous call (or the
+        start of the request) and starts the next lap"""
+        now: float = time.perf_counter()
+        elapsed: float = now-self._mark
+        self._mark = now
+        return elapsed
+
+
+class Hooks:
+    """The registry of hooks, which are called on stages of every request of
+    :class:`HTTPClient` and on building models by :class:`Client`
+
+    Every hook is a function, which takes :class:`RequestTrace` and must
+    return fast without raising, because it's called right inside the
+    request. If no hooks are registered, then requests aren't traced at all
+
+    Events
+    ------
+    on_request_start
+        Before every attempt of the request
+
+    on_response_headers
+        When the headers of response are received
+
+    on_body_done
+        When the whole body is read (or streamed)
+
+    on_decoded
+        When the body is decoded from JSON
+
+    on_model_built
+        When the model is built from the response
+
+    on_error
+        When the request fails after all its attempts or the response says
+        that the operation wasn't successful (for example,
+        :class:`UserNotFoundError`). The error is in :attr:`RequestTrace.error`.
+        Repeated attempts are seen by `on_request_start` with
+        :attr:`RequestTrace.attempt` more than `1`"""
+
+    __slots__ = ("_hooks", "active")
+
+    def __init__(self) -> None:
+        self._hooks: Dict[str, List[Hook]] = {e: [] for e in EVENTS}
+        self.active: bool = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(f'{e}={len(h)}' for e, h in self._hooks.items() if h)})"
+
+    def add(self, event: str, hook: Hook) -> None:
+        """Registers the hook of the event
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event. For example, `on_body_done`
+
+        hook: Callable[[:class:`RequestTrace`], `None`]
+            The function to call
+
+        Raises
+        ------
+        :class:`ValueError`
+            If there is no event with specified :param:`event` name"""
+        if event not in self._hooks:
+            raise ValueError(f"Unknown event \"{event}\", must be one of: {', '.join(EVENTS)}")
+
+        self._hooks[event].append(hook)
+        self.active = True
+
+    def remove(self, event: str, hook: Hook) -> None:
+        """Unregisters the hook of the event, if it's registered
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event
+
+        hook: Callable[[:class:`RequestTrace`], `None`]
+            The function to unregister"""
+        hooks: List[Hook] = self._hooks.get(event, [])
+        if hook in hooks:
+            hooks.remove(hook)
+
+        self.active = any(self._hooks.values())
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Callable[[Hook], Hook]: The decorator, which registers the function
+        as hook of the event. See :meth:`add`"""
+        def decorator(hook: Hook) -> Hook:
+            self.add(event, hook)
+            return hook
+
+        return decorator
+
+    def trace(self, method: str, url: str, endpoint: str) -> Optional[RequestTrace]:
+        """Optional[:class:`RequestTrace`]: Starts the trace of request and makes
+        it current (see :func:`current_trace`). If no hooks are registered, then
+        returns `None`"""
+        if not self.active:
+            return None
+
+        trace: RequestTrace = RequestTrace(method, url, endpoint)
+        _CURRENT.set(trace)
+        return trace
+
+    def emit(self, event: str, trace: RequestTrace) -> None:
+        """Calls all the hooks of the event
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event
+
+        trace: :class:`RequestTrace`
+            The trace of the request"""
+        for hook in self._hooks[event]:
+            hook(trace)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Optional[:class:`RequestTrace`]: Returns the trace of the last request
+    started in the current context, if it's traced"""
+    return _CURRENT.get()
@@ -6,23 +6,528 @@ The above copyright notice and this permission notice shall be included in all c
 
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
-from typing import Any, Final, Optional, TypeVar
+import asyncio
+import atexit
+import os
+import time
+from email.utils import parsedate_to_datetime
+from typing import IO, Any, AsyncIterator, Dict, Final, Optional, TypeVar, Union
+from urllib.parse import urlsplit
 
-from aiohttp import ClientResponse, ClientSession
+from .cache import ResponseCache
+from .decoders import JSONDecoder, get_decoder
+from .errors import HTTPException, PayloadTooLargeError
+from .hooks import Hooks, RequestTrace
+from .ratelimit import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+from .transport import AiohttpTransport, Transport, TransportResponse
 
-try:
-    import ujson as jsonlib
-
-except ModuleNotFoundError:
-    import json as jsonlib
-
-__all__ = ("request",)
+__all__ = ("HTTPClient", "default_http", "request", "stream", "download")
 
 _BASE: Final[str] = "https://ratings.tankionline.com/api/eu"
+CHUNK_SIZE: Final[int] = 64*1024
 T = TypeVar('T')
 
+
+class HTTPClient:
+    """The class that makes requests to API of this game through its
+    transport. By default, it's :class:`AiohttpTransport`, which owns a
+    long-lived :class:`aiohttp.ClientSession` with a pool of connections
+    
+    Parameters
+    ----------
+    limit_per_host: :class:`int`
+        The maximum count of simultaneous connections to one host. If `0`,
+        then it's unlimited. Ignored if :param:`transport` is specified. By
+        default, `10`
+
+    keepalive_timeout: :class:`float`
+        The time (in seconds) during which an idle connection is kept alive.
+        By default, `30.0`
+
+    ttl_dns_cache: Optional[:class:`int`]
+        The time (in seconds) for which resolved DNS records are cached. If
+        `None`, then they are cached forever. By default, `300`
+
+    timeout: Optional[:class:`float`]
+        The total timeout (in seconds) of every request. If `None`, then
+        the default timeout of :mod:`aiohttp` is used. By default, `None`
+
+    cache: Optional[:class:`ResponseCache`]
+        The cache for responses of `GET` requests. If `None`, then responses
+        aren't cached. By default, `None`
+
+    coalesce: :class:`bool`
+        Whether identical `GET` requests made at the same time share one
+        request and one decoded result. By default, `True`
+
+    limiter: Optional[:class:`RateLimiter`]
+        The limiter of requests rate. If `None`, then the rate isn't limited.
+        By default, `None`
+
+    retry: Optional[:class:`RetryPolicy`]
+        The policy of repeating failed requests. If `None`, then requests
+        aren't repeated. By default, `None`
+
+    breaker: Optional[:class:`CircuitBreaker`]
+        The circuit breaker, which blocks requests to failing hosts. If
+        `None`, then requests are never blocked. By default, `None`
+
+    decoder: Optional[:class:`str`]
+        The name of JSON backend (see :func:`get_decoder`). If `None`, then
+        the fastest installed one is used. By default, `None`
+
+    transport: Optional[:class:`Transport`]
+        The transport which sends requests. If `None`, then
+        :class:`AiohttpTransport` is created with connection options above.
+        By default, `None`
+
+    hooks: Optional[:class:`Hooks`]
+        The hooks which are called on stages of every request. If `None`,
+        then the empty registry is created, so hooks can be added later
+        through :attr:`hooks`. By default, `None`"""
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        decoder: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        hooks: Optional[Hooks] = None
+    ) -> None:
+        self.transport: Transport = transport or AiohttpTransport(limit_per_host=limit_per_host,
+                                                                  keepalive_timeout=keepalive_timeout,
+                                                                  ttl_dns_cache=ttl_dns_cache, timeout=timeout)
+        self.cache: Optional[ResponseCache] = cache
+        self.coalesce: bool = coalesce
+        self.limiter: Optional[RateLimiter] = limiter
+        self.retry: Optional[RetryPolicy] = retry
+        self.breaker: Optional[CircuitBreaker] = breaker
+        self.decoder_name: str
+        self._decode: JSONDecoder
+        self.decoder_name, self._decode = get_decoder(decoder)
+        self.hooks: Hooks = hooks if hooks is not None else Hooks()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict["asyncio.Future[Any]", int] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(transport={self.transport!r}, decoder={self.decoder_name!r})"
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether the transport of this client is closed"""
+        return self.transport.closed
+
+    async def close(self) -> None:
+        """Closes the transport of this client and all its pooled connections"""
+        self._inflight.clear()
+        self._waiters.clear()
+        await self.transport.close()
+
+    def decode(self, body: bytes) -> Any:
+        """:class:`Any`: Decodes JSON body by the backend of this client. It's
+        useful with `bytes=True` in :meth:`request`
+
+        Parameters
+        ----------
+        body: :class:`bytes`
+            The body of the response"""
+        return self._decode(body)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        base: Optional[str] = None,
+        bytes: bool = False,
+        cache: bool = True
+    ) -> Any:
+        """:class:`Any`: Makes a request to API of this game
+        
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the request. For example, `GET`
+            
+        endpoint: :class:`str`
+            The endpoint of the request
+            
+        base: Optional[:class:`str`]
+            The base of request URL. If specified `None`, then uses
+            `https://ratings.tankionline.com/api/eu`. By default, `None`
+            
+        bytes: :class:`bool`
+            Whether to set the type of function output to :class:`bytes`. By
+            default, `False`
+
+        cache: :class:`bool`
+            Whether the response can be taken from or saved to :attr:`cache`.
+            By default, `True`"""
+        url: str = (base or _BASE)+endpoint
+        path: str = endpoint.split("?", 1)[0]
+        trace: Optional[RequestTrace] = self.hooks.trace(method, url, path) if self.hooks.active else None
+        if method != "GET":
+            return await self._request(method, url, bytes=bytes, trace=trace)
+
+        ttl: Optional[float] = None if self.cache is None else self.cache.ttl_for(path)
+        if self.cache is None or ttl is None or not cache:
+            return await self._coalesced(method, url, bytes=bytes, trace=trace)
+
+        key: str = f"{method} {url}" + (" (bytes)" if bytes else "")
+        found, value = self.cache.get(key)
+        if found:
+            if trace is not None:
+                trace.cached = True
+
+            return value
+
+        value = await self._coalesced(method, url, bytes=bytes, trace=trace)
+        self.cache.set(key, value, ttl)
+        return value
+
+    async def _coalesced(
+        self,
+        method: str,
+        url: str,
+        *,
+        bytes: bool = False,
+        trace: Optional[RequestTrace] = None
+    ) -> Any:
+        if not self.coalesce:
+            return await self._request(method, url, bytes=bytes, trace=trace)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # requests of another (maybe already closed) loop can't be awaited here
+            self._inflight.clear()
+            self._waiters.clear()
+            self._loop = loop
+
+        key: str = f"{method} {url} {bytes}"
+        future: Optional["asyncio.Future[Any]"] = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(method, url, bytes=bytes, trace=trace))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+
+        elif trace is not None:
+            trace.cached = True
+
+        # the request is shielded, so if one of waiters is cancelled, then the others
+        # still receive the result
+        self._waiters[future] = self._waiters.get(future, 0)+1
+        try:
+            return await asyncio.shield(future)
+
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                # all the waiters are cancelled, so nobody needs the request anymore
+                future.cancel()
+
+    def _done(self, key: str, future: "asyncio.Future[Any]") -> None:
+        self._inflight.pop(key, None)
+        # if the request fails right when all its waiters are cancelled, then nobody
+        # retrieves the error, so it's retrieved here to not be logged as lost
+        if not future.cancelled():
+            future.exception()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        bytes: bool = False,
+        trace: Optional[RequestTrace] = None
+    ) -> Any:
+        host: str = urlsplit(url).hostname or ""
+        retry: Optional[RetryPolicy] = self.retry if self.retry is not None and method in self.retry.methods else None
+        started: float = time.monotonic()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            if self.breaker is not None:
+                self.breaker.before_request(host)
+
+            try:
+                value: Any = await self._send(method, url, host, bytes=bytes, trace=trace)
+
+            except Exception as error:  # pylint: disable=W0703
+                if trace is not None:
+                    trace.error = error
+
+                if self.breaker is not None:
+                    self.breaker.record_failure(host, error)
+
+                delay: Optional[float] = None if retry is None else retry.next_delay(error, attempt,
+                                                                                     time.monotonic()-started)
+                if delay is None:
+                    # the error is emitted once per request, when it isn't repeated anymore
+                    if trace is not None:
+                        self.hooks.emit("on_error", trace)
+
+                    raise
+
+                await asyncio.sleep(delay)
+                continue
+
+            if self.breaker is not None:
+                self.breaker.record_success(host)
+
+            return value
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        host: str,
+        *,
+        bytes: bool = False,
+        trace: Optional[RequestTrace] = None
+    ) -> Any:
+        if self.limiter is not None:
+            await self.limiter.acquire(host)
+
+        if trace is None:
+            async with self.transport.request(method, url) as response:
+                self._check_response(host, url, response)
+                body = await response.read()
+                return body if bytes else self._decode(body)
+
+        # the same as above, but with timings of every stage
+        trace.attempt += 1
+        trace.lap()
+        self.hooks.emit("on_request_start", trace)
+        async with self.transport.request(method, url) as response:
+            trace.headers_time, trace.status = trace.lap(), response.status
+            self.hooks.emit("on_response_headers", trace)
+            self._check_response(host, url, response)
+            body = await response.read()
+            trace.body_time, trace.size = trace.lap(), len(body)
+            self.hooks.emit("on_body_done", trace)
+
+        if bytes:
+            return body
+
+        value: Any = self._decode(body)
+        trace.decode_time = trace.lap()
+        self.hooks.emit("on_decoded", trace)
+        return value
+
+    def _check_response(self, host: str, url: str, response: TransportResponse) -> None:
+        retry_after: Optional[float] = _parse_retry_after(response.headers.get("Retry-After"))
+        if self.limiter is not None:
+            self.limiter.feedback(host, response.status, retry_after=retry_after)
+
+        if response.status == 429 or response.status >= 500:
+            raise HTTPException(response.status, url, f"API responded with {response.status} status",
+                                retry_after=retry_after)
+
+    async def stream(
+        self,
+        url: str,
+        *,
+        chunk_size: int = CHUNK_SIZE,
+        max_bytes: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """:class:`bytes`: Makes `GET` request and yields the body of response by
+        chunks, so it's never fully kept in memory. For example, it's useful for
+        images of game objects
+        
+        Parameters
+        ----------
+        url: :class:`str`
+            The full URL of the request
+            
+        chunk_size: :class:`int`
+            The maximum size (in bytes) of one chunk. By default, `65536`
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the body. If `None`, then it's
+            unlimited. By default, `None`
+        
+        Raises
+        ------
+        :class:`PayloadTooLargeError`
+            If the body is bigger than :param:`max_bytes`"""
+        parts = urlsplit(url)
+        host: str = parts.hostname or ""
+        trace: Optional[RequestTrace] = self.hooks.trace("GET", url, parts.path) if self.hooks.active else None
+        if self.breaker is not None:
+            self.breaker.before_request(host)
+
+        if self.limiter is not None:
+            await self.limiter.acquire(host)
+
+        try:
+            if trace is not None:
+                trace.attempt = 1
+                trace.lap()
+                self.hooks.emit("on_request_start", trace)
+
+            async with self.transport.request("GET", url) as response:
+                if trace is not None:
+                    trace.headers_time, trace.status = trace.lap(), response.status
+                    self.hooks.emit("on_response_headers", trace)
+
+                self._check_response(host, url, response)
+                if max_bytes is not None and (response.content_length or 0) > max_bytes:
+                    raise PayloadTooLargeError(url, max_bytes, f"The body is bigger than {max_bytes} bytes")
+
+                received: int = 0
+                async for chunk in response.iter_chunked(chunk_size):
+                    received += len(chunk)
+                    if max_bytes is not None and received > max_bytes:
+                        raise PayloadTooLargeError(url, max_bytes, f"The body is bigger than {max_bytes} bytes")
+
+                    yield chunk
+
+            if trace is not None:
+                trace.body_time, trace.size = trace.lap(), received
+                self.hooks.emit("on_body_done", trace)
+
+        except Exception as error:
+            if trace is not None:
+                trace.error = error
+                self.hooks.emit("on_error", trace)
+
+            if self.breaker is not None:
+                self.breaker.record_failure(host, error)
+
+            raise
+
+        if self.breaker is not None:
+            self.breaker.record_success(host)
+
+    async def download(
+        self,
+        url: str,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        chunk_size: int = CHUNK_SIZE,
+        max_bytes: Optional[int] = None
+    ) -> int:
+        """:class:`int`: Streams the body of response to file and returns its size
+        (in bytes). See :meth:`stream`
+        
+        Parameters
+        ----------
+        url: :class:`str`
+            The full URL of the request
+            
+        destination: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+            The path to the file or the binary file-like object. If it's path,
+            then the body is written to the temporary file next to it, which
+            replaces the file only when the download is complete, so the
+            existing file is kept if the download fails
+            
+        chunk_size: :class:`int`
+            The maximum size (in bytes) of one chunk. By default, `65536`
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the body. If `None`, then it's
+            unlimited. By default, `None`
+        
+        Raises
+        ------
+        :class:`PayloadTooLargeError`
+            If the body is bigger than :param:`max_bytes`"""
+        if not isinstance(destination, (str, os.PathLike)):
+            return await self._write(url, destination, chunk_size=chunk_size, max_bytes=max_bytes)
+
+        path: str = os.fspath(destination)
+        temporary: str = f"{path}.tmp"
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        try:
+            writer: IO[bytes] = await loop.run_in_executor(None, open, temporary, "wb")
+            try:
+                written: int = await self._write(url, writer, chunk_size=chunk_size, max_bytes=max_bytes)
+
+            finally:
+                await loop.run_in_executor(None, writer.close)
+
+            await loop.run_in_executor(None, os.replace, temporary, path)
+            return written
+
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+            raise
+
+    async def _write(self, url: str, writer: IO[bytes], *, chunk_size: int, max_bytes: Optional[int]) -> int:
+        # files are written in the default executor, so slow disks don't block the loop
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        written: int = 0
+        async for chunk in self.stream(url, chunk_size=chunk_size, max_bytes=max_bytes):
+            await loop.run_in_executor(None, writer.write, chunk)
+            written += len(chunk)
+
+        return written
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Optional[:class:`float`]: Converts value of `Retry-After` header, which
+    is either count of seconds or HTTP date, to seconds"""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp()-time.time(), 0.0)
+
+    except (TypeError, ValueError):
+        return None
+
+
+_DEFAULT: Optional[HTTPClient] = None
+
+
+def default_http() -> HTTPClient:
+    """:class:`HTTPClient`: Returns the default HTTP client, which is used by
+    :func:`request` and module-level functions. It's created on the first call
+    and closed at exit"""
+    global _DEFAULT  # pylint: disable=W0603
+    if _DEFAULT is None:
+        _DEFAULT = HTTPClient()
+        atexit.register(_close_default)
+
+    return _DEFAULT
+
+
+def _close_default() -> None:
+    """Closes the default HTTP client at exit, so its session isn't reported
+    as unclosed"""
+    if _DEFAULT is not None and not _DEFAULT.closed:
+        asyncio.run(_DEFAULT.close())
+
+
 async def request(method: str, endpoint: str, *, base: Optional[str] = None, bytes: bool = False) -> Any:
-    """:class:`Any`: Makes a request to API of this game
+    """:class:`Any`: Makes a request to API of this game using the default
+    HTTP client (see :func:`default_http`)
     
     Parameters
     ----------
@@ -39,7 +544,49 @@ async def request(method: str, endpoint: str, *, base: Optional[str] = None, byt
     bytes: :class:`bool`
         Whether to set the type of function output to :class:`bytes`. By
         default, `False`"""
-    async with ClientSession() as session:
-        response: ClientResponse = await session.request(method, (base or _BASE)+endpoint)
+    return await default_http().request(method, endpoint, base=base, bytes=bytes)
+
 
-    return await response.read() if bytes else jsonlib.loads(await response.text())
+def stream(url: str, *, chunk_size: int = CHUNK_SIZE, max_bytes: Optional[int] = None) -> AsyncIterator[bytes]:
+    """:class:`bytes`: Streams the body of response by chunks using the default
+    HTTP client. See :meth:`HTTPClient.stream`
+    
+    Parameters
+    ----------
+    url: :class:`str`
+        The full URL of the request
+        
+    chunk_size: :class:`int`
+        The maximum size (in bytes) of one chunk. By default, `65536`
+        
+    max_bytes: Optional[:class:`int`]
+        The maximum allowed size (in bytes) of the body. If `None`, then it's
+        unlimited. By default, `None`"""
+    return default_http().stream(url, chunk_size=chunk_size, max_bytes=max_bytes)
+
+
+async def download(
+    url: str,
+    destination: Union[str, "os.PathLike[str]", IO[bytes]],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    max_bytes: Optional[int] = None
+) -> int:
+    """:class:`int`: Streams the body of response to file using the default HTTP
+    client and returns its size (in bytes). See :meth:`HTTPClient.download`
+    
+    Parameters
+    ----------
+    url: :class:`str`
+        The full URL of the request
+        
+    destination: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+        The path to the file or the binary file-like object
+        
+    chunk_size: :class:`int`
+        The maximum size (in bytes) of one chunk. By default, `65536`
+        
+    max_bytes: Optional[:class:`int`]
+        The maximum allowed size (in bytes) of the body. If `None`, then it's
+        unlimited. By default, `None`"""
+    return await default_http().download(url, destination, chunk_size=chunk_size, max_bytes=max_bytes)
@@ -0,0 +1,244 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Final, List, Optional, Pattern, Sequence, Tuple
+
+from .cache import ResponseCache
+from .hooks import Hooks, RequestTrace
+
+__all__ = ("Metrics",)
+
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_ID: Final[Pattern[str]] = re.compile(r"/\d+(?=/|$)")
+
+
+class _Histogram:
+    """The histogram with fixed buckets. Counts aren't cumulative until they
+    are exported"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds: Sequence[float] = bounds
+        self.counts: List[int] = [0]*(len(bounds)+1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """Adds the value to the bucket, whose upper bound isn't less than it
+
+        Parameters
+        ----------
+        value: :class:`float`
+            The observed value"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """List[Tuple[:class:`str`, :class:`int`]]: Returns the upper bounds of
+        buckets with counts of values, which aren't more than them. The last
+        bound is `+Inf`"""
+        output: List[Tuple[str, int]] = []
+        total: int = 0
+        for bound, count in zip([*map(repr, self.bounds), "+Inf"], self.counts):
+            total += count
+            output.append((bound, total))
+
+        return output
+
+    def to_json(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, :class:`Any`]: Converts the histogram to JSON"""
+        return {"count": self.count, "sum": self.sum, "buckets": dict(self.cumulative())}
+
+
+class Metrics:
+    """The registry of aggregated metrics of the client: counts of requests
+    and errors by endpoint, latency histograms, transferred bytes and cache
+    hits. It's updated by hooks (see :class:`Hooks`), so it costs a few
+    dictionary updates per request
+
+    Counters aren't protected by locks, because all the hooks of one client
+    are called in its event loop. Don't share one registry between clients
+    running in different threads
+
+    Endpoints are labelled by path of URL where numeric segments are replaced
+    with `{id}`, so the count of labels doesn't grow with count of articles
+
+    Parameters
+    ----------
+    buckets: Sequence[:class:`float`]
+        The upper bounds (in seconds) of latency histograms' buckets. By
+        default, from `0.005` to `10.0`
+
+    prefix: :class:`str`
+        The prefix of metric names in Prometheus format. By default, `toapi`"""
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "toapi") -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.prefix: str = prefix
+        self.cache: Optional[ResponseCache] = None
+
+        self._requests: Dict[Tuple[str, int], int] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[str, int] = {}
+        self._cached: Dict[str, int] = {}
+        self._latency: Dict[str, _Histogram] = {}
+        self._decode: Dict[str, _Histogram] = {}
+        self._build: Dict[str, _Histogram] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(requests={sum(self._requests.values())}, " \
+               f"errors={sum(self._errors.values())})"
+
+    def attach(self, hooks: Hooks, cache: Optional[ResponseCache] = None) -> None:
+        """Registers hooks, which update this registry
+
+        Parameters
+        ----------
+        hooks: :class:`Hooks`
+            The hooks of the client. For example, `client.http.hooks`
+
+        cache: Optional[:class:`ResponseCache`]
+            The cache of the client, whose hits and misses are exported. By
+            default, `None`"""
+        hooks.add("on_response_headers", self._on_response_headers)
+        hooks.add("on_body_done", self._on_body_done)
+        hooks.add("on_decoded", self._on_decoded)
+        hooks.add("on_model_built", self._on_model_built)
+        hooks.add("on_error", self._on_error)
+        if cache is not None:
+            self.cache = cache
+
+    def detach(self, hooks: Hooks) -> None:
+        """Unregisters hooks of this registry
+
+        Parameters
+        ----------
+        hooks: :class:`Hooks`
+            The hooks of the client"""
+        hooks.remove("on_response_headers", self._on_response_headers)
+        hooks.remove("on_body_done", self._on_body_done)
+        hooks.remove("on_decoded", self._on_decoded)
+        hooks.remove("on_model_built", self._on_model_built)
+        hooks.remove("on_error", self._on_error)
+
+    def reset(self) -> None:
+        """Resets all the metrics to zero"""
+        for metric in (self._requests, self._errors, self._bytes, self._cached, self._latency, self._decode,
+                       self._build):
+            metric.clear()
+
+    def _histogram(self, metric: Dict[str, _Histogram], key: str) -> _Histogram:
+        histogram: Optional[_Histogram] = metric.get(key)
+        if histogram is None:
+            histogram = metric[key] = _Histogram(self.buckets)
+
+        return histogram
+
+    def _on_response_headers(self, trace: RequestTrace) -> None:
+        key: Tuple[str, int] = (_ID.sub("/{id}", trace.endpoint), trace.status or 0)
+        self._requests[key] = self._requests.get(key, 0)+1
+
+    def _on_body_done(self, trace: RequestTrace) -> None:
+        endpoint: str = _ID.sub("/{id}", trace.endpoint)
+        self._bytes[endpoint] = self._bytes.get(endpoint, 0)+(trace.size or 0)
+        self._histogram(self._latency, endpoint).observe((trace.headers_time or 0.0)+(trace.body_time or 0.0))
+
+    def _on_decoded(self, trace: RequestTrace) -> None:
+        self._histogram(self._decode, _ID.sub("/{id}", trace.endpoint)).observe(trace.decode_time or 0.0)
+
+    def _on_model_built(self, trace: RequestTrace) -> None:
+        if trace.cached:
+            endpoint: str = _ID.sub("/{id}", trace.endpoint)
+            self._cached[endpoint] = self._cached.get(endpoint, 0)+1
+
+        self._histogram(self._build, trace.model or "").observe(trace.build_time or 0.0)
+
+    def _on_error(self, trace: RequestTrace) -> None:
+        key: Tuple[str, str] = (_ID.sub("/{id}", trace.endpoint), type(trace.error).__name__)
+        self._errors[key] = self._errors.get(key, 0)+1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, Any]: Returns all the metrics as dictionary, which
+        can be serialized to JSON. Histograms contain cumulative counts of
+        buckets by their upper bounds"""
+        requests: Dict[str, Dict[str, int]] = {}
+        for (endpoint, status), count in self._requests.items():
+            requests.setdefault(endpoint, {})[str(status)] = count
+
+        errors: Dict[str, Dict[str, int]] = {}
+        for (endpoint, error), count in self._errors.items():
+            errors.setdefault(endpoint, {})[error] = count
+
+        output: Dict[str, Any] = {
+            "requests": requests,
+            "errors": errors,
+            "bytes": dict(self._bytes),
+            "cached": dict(self._cached),
+            "latency": {e: h.to_json() for e, h in self._latency.items()},
+            "decode": {e: h.to_json() for e, h in self._decode.items()},
+            "build": {m: h.to_json() for m, h in self._build.items()}
+        }
+        if self.cache is not None:
+            output["cache"] = {"hits": self.cache.hits, "misses": self.cache.misses, "hit_ratio": self.cache.hit_ratio}
+
+        return output
+
+    def render(self) -> str:
+        """:class:`str`: Returns all the metrics in text format of Prometheus,
+        which can be served on `/metrics` endpoint"""
+        lines: List[str] = []
+        name: str = f"{self.prefix}_requests_total"
+        lines += [f"# HELP {name} The count of responses by endpoint and status", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(endpoint=e, status=s)} {c}" for (e, s), c in self._requests.items()]
+
+        name = f"{self.prefix}_errors_total"
+        lines += [f"# HELP {name} The count of failed requests by endpoint and error", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(endpoint=e, error=t)} {c}" for (e, t), c in self._errors.items()]
+
+        name = f"{self.prefix}_response_bytes_total"
+        lines += [f"# HELP {name} The size of received bodies", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(endpoint=e)} {c}" for e, c in self._bytes.items()]
+
+        name = f"{self.prefix}_cached_responses_total"
+        lines += [f"# HELP {name} The count of responses taken from the cache or the identical request",
+                  f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(endpoint=e)} {c}" for e, c in self._cached.items()]
+
+        for metric, label, histograms, description in (
+            ("request_duration_seconds", "endpoint", self._latency, "The time of receiving the response"),
+            ("decode_duration_seconds", "endpoint", self._decode, "The time of decoding JSON"),
+            ("build_duration_seconds", "model", self._build, "The time of building the model")
+        ):
+            name = f"{self.prefix}_{metric}"
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+            for key, histogram in histograms.items():
+                lines += [f"{name}_bucket{_labels(**{label: key, 'le': b})} {c}" for b, c in histogram.cumulative()]
+                lines += [f"{name}_sum{_labels(**{label: key})} {histogram.sum!r}",
+                          f"{name}_count{_labels(**{label: key})} {histogram.count}"]
+
+        if self.cache is not None:
+            for metric, value in (("cache_hits_total", self.cache.hits), ("cache_misses_total", self.cache.misses)):
+                name = f"{self.prefix}_{metric}"
+                lines += [f"# TYPE {name} counter", f"{name} {value}"]
+
+        return "\n".join(lines)+"\n"
+
+
+def _labels(**labels: Any) -> str:
+    """:class:`str`: Formats labels of the sample in Prometheus format"""
+    values: str = ",".join(f"{k}=\"{_escape(str(v))}\"" for k, v in labels.items())
+    return f"{{{values}}}"
+
+
+def _escape(value: str) -> str:
+    """:class:`str`: Escapes the value of label in Prometheus format"""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
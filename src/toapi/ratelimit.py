@@ -0,0 +1,158 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import time
+from typing import Dict, Final, FrozenSet, Mapping, Optional
+
+__all__ = ("RateLimiter",)
+
+
+THROTTLE_STATUSES: Final[FrozenSet[int]] = frozenset({429, 503})
+
+
+class _Bucket:
+    """The state of token bucket of one host"""
+
+    __slots__ = ("rate", "max_rate", "tokens", "updated", "blocked_until")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate: float = rate
+        self.max_rate: float = rate
+        self.tokens: float = burst
+        self.updated: float = time.monotonic()
+        self.blocked_until: float = 0.0
+
+
+class RateLimiter:
+    """The client-side limiter of requests rate with separate token bucket for
+    each host
+
+    When the API responds with `429` or `503` status, then the rate of that
+    host is multiplied by :attr:`decrease` (but not less than :attr:`min_rate`)
+    and the host is paused for `Retry-After` seconds if specified. Every
+    successful response increases the rate by :attr:`increase` back up to the
+    configured rate
+    
+    Parameters
+    ----------
+    rate: :class:`float`
+        The maximum count of requests per second to one host. By default, `10.0`
+        
+    burst: Optional[:class:`float`]
+        The maximum count of requests that can be made at once after idle
+        time. If `None`, then it's equal to :param:`rate`. By default, `None`
+        
+    per_host: Optional[Mapping[:class:`str`, :class:`float`]]
+        The mapping where key is hostname and value is its own maximum rate.
+        By default, `None`
+        
+    min_rate: :class:`float`
+        The minimum rate to which throttling can slow down. By default, `0.5`
+        
+    decrease: :class:`float`
+        The multiplier of the rate on throttling. By default, `0.5`
+        
+    increase: :class:`float`
+        The number added to the rate on every successful response. By
+        default, `0.1`"""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        *,
+        burst: Optional[float] = None,
+        per_host: Optional[Mapping[str, float]] = None,
+        min_rate: float = 0.5,
+        decrease: float = 0.5,
+        increase: float = 0.1
+    ) -> None:
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError("Values of \"rate\" and \"min_rate\" parameters must be more than 0")
+
+        if not 0 < decrease < 1:
+            raise ValueError("Value of \"decrease\" parameter must be between 0 and 1")
+
+        self.rate: float = rate
+        self.burst: Optional[float] = burst
+        self.per_host: Dict[str, float] = dict(per_host or {})
+        self.min_rate: float = min_rate
+        self.decrease: float = decrease
+        self.increase: float = increase
+
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rate={self.rate}, hosts={len(self._buckets)})"
+
+    def _bucket(self, host: str) -> _Bucket:
+        bucket: Optional[_Bucket] = self._buckets.get(host)
+        if bucket is None:
+            rate: float = self.per_host.get(host, self.rate)
+            bucket = self._buckets[host] = _Bucket(rate, rate if self.burst is None else self.burst)
+
+        return bucket
+
+    def _refill(self, bucket: _Bucket) -> float:
+        now: float = time.monotonic()
+        burst: float = bucket.max_rate if self.burst is None else self.burst
+        bucket.tokens = min(burst, bucket.tokens + (now-bucket.updated)*bucket.rate)
+        bucket.updated = now
+        return now
+
+    def current_rate(self, host: str) -> float:
+        """:class:`float`: Gets current (maybe slowed down) rate of the host
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `ratings.tankionline.com`"""
+        return self._bucket(host).rate
+
+    async def acquire(self, host: str) -> None:
+        """Waits until a request to the host can be made
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `ratings.tankionline.com`"""
+        bucket: _Bucket = self._bucket(host)
+        now: float = self._refill(bucket)
+
+        # the token is reserved right away, so concurrent waiters queue up one
+        # after another instead of waking up all at once
+        bucket.tokens -= 1
+        delay: float = max(bucket.blocked_until-now, 0.0)
+        if bucket.tokens < 0:
+            delay = max(delay, -bucket.tokens/bucket.rate)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def feedback(self, host: str, status: int, *, retry_after: Optional[float] = None) -> None:
+        """Adapts the rate of the host to status of the response
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `ratings.tankionline.com`
+            
+        status: :class:`int`
+            The HTTP status of the response
+            
+        retry_after: Optional[:class:`float`]
+            The value of `Retry-After` header in seconds. By default, `None`"""
+        bucket: _Bucket = self._bucket(host)
+        self._refill(bucket)  # the tokens earned before must be counted with the old rate
+        if status in THROTTLE_STATUSES:
+            bucket.rate = max(self.min_rate, bucket.rate*self.decrease)
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic()+retry_after)
+
+        elif status < 400 and bucket.rate < bucket.max_rate:
+            bucket.rate = min(bucket.max_rate, bucket.rate+self.increase)
@@ -0,0 +1,211 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import random
+import time
+from typing import Dict, Final, FrozenSet, Iterable, Optional, Tuple, Type
+
+from aiohttp import ClientError
+
+from .errors import CircuitOpenError, HTTPException
+
+__all__ = ("RetryPolicy", "CircuitBreaker", "is_transient")
+
+
+TRANSPORT_ERRORS: Final[Tuple[Type[BaseException], ...]] = (ClientError, asyncio.TimeoutError)
+
+
+def is_transient(error: BaseException) -> bool:
+    """:class:`bool`: Checks whether the error is caused by temporary problems
+    of network or the API, that's, whether the request can be repeated
+    
+    Parameters
+    ----------
+    error: :class:`BaseException`
+        The error raised by the request"""
+    if isinstance(error, HTTPException):
+        return error.status == 429 or error.status >= 500
+
+    return isinstance(error, TRANSPORT_ERRORS)
+
+
+class RetryPolicy:
+    """The policy of repeating failed requests with jittered exponential backoff
+
+    Only transient errors (see :func:`is_transient`) of requests with one of
+    :attr:`methods` are repeated. The delay before the attempt `N` is random
+    value from `0` to `min(max_delay, base_delay * 2**N)`, but not less than
+    `Retry-After` of the response
+    
+    Parameters
+    ----------
+    max_attempts: :class:`int`
+        The maximum count of attempts, including the first. By default, `3`
+        
+    base_delay: :class:`float`
+        The base of delay (in seconds) between attempts. By default, `0.5`
+        
+    max_delay: :class:`float`
+        The maximum delay (in seconds) between attempts. By default, `10.0`
+        
+    max_elapsed: Optional[:class:`float`]
+        The maximum time (in seconds) spent on all attempts. If the next
+        delay exceeds it, then the error is raised. If `None`, then it's
+        unlimited. By default, `30.0`
+        
+    methods: Iterable[:class:`str`]
+        The idempotent methods, which can be repeated. By default, `GET` and
+        `HEAD`"""
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        max_elapsed: Optional[float] = 30.0,
+        methods: Iterable[str] = ("GET", "HEAD")
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("Value of \"max_attempts\" parameter must be more than 0")
+
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.max_elapsed: Optional[float] = max_elapsed
+        self.methods: FrozenSet[str] = frozenset(m.upper() for m in methods)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_attempts={self.max_attempts}, base_delay={self.base_delay})"
+
+    def next_delay(self, error: BaseException, attempt: int, elapsed: float) -> Optional[float]:
+        """Optional[:class:`float`]: Gets the delay (in seconds) before the next
+        attempt. If the request mustn't be repeated, then returns `None`
+        
+        Parameters
+        ----------
+        error: :class:`BaseException`
+            The error raised by the last attempt
+            
+        attempt: :class:`int`
+            The number of the last attempt, starting from `1`
+            
+        elapsed: :class:`float`
+            The time (in seconds) spent since the first attempt"""
+        if attempt >= self.max_attempts or not is_transient(error):
+            return None
+
+        delay: float = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        if isinstance(error, HTTPException) and error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+
+        if self.max_elapsed is not None and elapsed+delay > self.max_elapsed:
+            return None
+
+        return delay
+
+
+class CircuitBreaker:
+    """The per-host circuit breaker. When the host fails :attr:`threshold`
+    times in a row, then all requests to it fail fast with
+    :class:`CircuitOpenError` during :attr:`reset_timeout` seconds
+
+    After that, one trial request is let through: if it succeeds, then the
+    circuit is closed, otherwise it's opened again. Throttling (`429`) isn't
+    counted as a failure
+    
+    Parameters
+    ----------
+    threshold: :class:`int`
+        The count of consecutive failures that opens the circuit. By
+        default, `5`
+        
+    reset_timeout: :class:`float`
+        The time (in seconds) during which the circuit stays open. By
+        default, `30.0`"""
+
+    def __init__(self, *, threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if threshold < 1:
+            raise ValueError("Value of \"threshold\" parameter must be more than 0")
+
+        self.threshold: int = threshold
+        self.reset_timeout: float = reset_timeout
+
+        self._failures: Dict[str, int] = {}
+        self._opened_until: Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(threshold={self.threshold}, open={len(self._opened_until)})"
+
+    def is_open(self, host: str) -> bool:
+        """:class:`bool`: Whether requests to the host are blocked now
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `tankisport.com`"""
+        return self._opened_until.get(host, 0.0) > time.monotonic()
+
+    def before_request(self, host: str) -> None:
+        """Checks whether the request to the host can be made
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `tankisport.com`
+        
+        Raises
+        ------
+        :class:`CircuitOpenError`
+            If the circuit of the host is open"""
+        opened_until: Optional[float] = self._opened_until.get(host)
+        if opened_until is None:
+            return
+
+        now: float = time.monotonic()
+        if opened_until > now:
+            raise CircuitOpenError(host, opened_until-now, f"Requests to {host} are blocked after many failures")
+
+        # half-open state: this request is the trial one, the others still fail fast
+        # until it finishes or the timeout passes again
+        self._opened_until[host] = now+self.reset_timeout
+
+    def record_success(self, host: str) -> None:
+        """Closes the circuit of the host
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `tankisport.com`"""
+        self._failures.pop(host, None)
+        self._opened_until.pop(host, None)
+
+    def record_failure(self, host: str, error: BaseException) -> None:
+        """Counts the error of the request to the host, if it's failure of the
+        host, and opens the circuit if there are too many failures
+        
+        Parameters
+        ----------
+        host: :class:`str`
+            The hostname. For example, `tankisport.com`
+            
+        error: :class:`BaseException`
+            The error raised by the request"""
+        if not is_transient(error) or (isinstance(error, HTTPException) and error.status == 429):
+            return
+
+        failures: int = self._failures.get(host, 0)+1
+        self._failures[host] = failures
+        if failures >= self.threshold or host in self._opened_until:
+            self._opened_until[host] = time.monotonic()+self.reset_timeout
+
+    def reset(self) -> None:
+        """Closes circuits of all hosts"""
+        self._failures.clear()
+        self._opened_until.clear()
@@ -0,0 +1,197 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+# models are built by their `_from_fields`, which is shared with `from_json`
+# pylint: disable=W0212
+
+from typing import Any, List, Optional
+
+import msgspec
+
+from .types import GameObject, Mode, Rating, Ratings, SuppliesObject, Top, TopLists, TopListUser, User
+
+__all__ = ("decode_user_response", "decode_tops_response")
+
+
+class GameObjectSchema(msgspec.Struct, rename="camel"):
+    """The schema of :class:`GameObject` in responses of API"""
+
+    id: int
+    image_url: str
+    name: str
+    grade: int
+    properties: Optional[List[Any]]
+    score_earned: int
+    time_played: float
+
+
+class SuppliesObjectSchema(msgspec.Struct, rename="camel"):
+    """The schema of :class:`SuppliesObject` in responses of API"""
+
+    id: int
+    image_url: str
+    name: str
+    usages: int
+
+
+class ModeSchema(msgspec.Struct, rename="camel"):
+    """The schema of :class:`Mode` in responses of API"""
+
+    name: str
+    score_earned: int
+    time_played: float
+    type: str
+
+
+class RatingSchema(msgspec.Struct):
+    """The schema of :class:`Rating` in responses of API"""
+
+    position: int
+    value: int
+
+
+class RatingsSchema(msgspec.Struct):
+    """The schema of :class:`Ratings` in responses of API"""
+
+    crystals: Optional[RatingSchema]
+    efficiency: Optional[RatingSchema]
+    golds: Optional[RatingSchema]
+    score: Optional[RatingSchema]
+
+
+class UserSchema(msgspec.Struct, rename="camel"):
+    """The schema of :class:`User` in responses of API"""
+
+    name: str
+    rank: int
+    has_premium: bool
+    kills: int
+    deaths: int
+    caught_golds: int
+    drones_played: List[GameObjectSchema]
+    earned_crystals: int
+    gear_score: int
+    hulls_played: List[GameObjectSchema]
+    modes_played: List[ModeSchema]
+    mounted: Any
+    paints_played: List[GameObjectSchema]
+    presents: Any
+    previous_rating: RatingsSchema
+    rating: RatingsSchema
+    resistance_modules: List[GameObjectSchema]
+    score: int
+    score_base: int
+    score_next: int
+    supplies_usage: List[SuppliesObjectSchema]
+    turrets_played: List[GameObjectSchema]
+
+
+class TopListUserSchema(msgspec.Struct, rename="camel"):
+    """The schema of :class:`TopListUser` in responses of API"""
+
+    uid: str
+    rank: int
+    has_premium: bool
+    value: int
+
+
+class TopListsSchema(msgspec.Struct):
+    """The schema of :class:`TopLists` in responses of API"""
+
+    crystals: List[TopListUserSchema]
+    efficiency: List[TopListUserSchema]
+    golds: List[TopListUserSchema]
+    score: List[TopListUserSchema]
+
+
+class ResponseSchema(msgspec.Struct, rename="camel"):
+    """The schema of the envelope of responses from ratings API. The payload is
+    kept undecoded until the type of response is checked"""
+
+    response_type: str
+    response: msgspec.Raw = msgspec.Raw()
+
+
+_RESPONSE_DECODER = msgspec.json.Decoder(ResponseSchema)
+_USER_DECODER = msgspec.json.Decoder(UserSchema)
+_TOPS_DECODER = msgspec.json.Decoder(TopListsSchema)
+
+
+def _game_objects(schemas: List[GameObjectSchema]) -> List[GameObject]:
+    return [GameObject._from_fields(s.grade, s.id, s.image_url, s.name, s.properties, s.score_earned, s.time_played)
+            for s in schemas]
+
+
+def _supplies(schemas: List[SuppliesObjectSchema]) -> List[SuppliesObject]:
+    return [SuppliesObject._from_fields(s.id, s.image_url, s.name, s.usages) for s in schemas]
+
+
+def _modes(schemas: List[ModeSchema]) -> List[Mode]:
+    return [Mode._from_fields(s.name, s.score_earned, s.time_played, s.type) for s in schemas]
+
+
+def _rating(schema: Optional[RatingSchema]) -> Optional[Rating]:
+    return None if schema is None else Rating(schema.position, schema.value)
+
+
+def _ratings(schema: RatingsSchema) -> Ratings:
+    return Ratings._from_fields(_rating(schema.crystals), _rating(schema.efficiency), _rating(schema.golds),
+                                _rating(schema.score))
+
+
+def _user(schema: UserSchema) -> User:
+    self: User = User._from_fields(schema.name, schema.rank, schema.has_premium, schema.kills, schema.deaths,
+                                   schema.caught_golds, schema.earned_crystals, schema.gear_score, schema.mounted,
+                                   schema.presents, schema.score, schema.score_base, schema.score_next)
+    self.drones_played = _game_objects(schema.drones_played)
+    self.hulls_played = _game_objects(schema.hulls_played)
+    self.modes_played = _modes(schema.modes_played)
+    self.paints_played = _game_objects(schema.paints_played)
+    self.previous_rating = _ratings(schema.previous_rating)
+    self.rating = _ratings(schema.rating)
+    self.resistance_modules = _game_objects(schema.resistance_modules)
+    self.supplies_usage = _supplies(schema.supplies_usage)
+    self.turrets_played = _game_objects(schema.turrets_played)
+    return self
+
+
+def _top(name: str, schemas: List[TopListUserSchema]) -> Top:
+    return Top(name, [TopListUser._from_fields(s.uid, s.rank, s.has_premium, s.value, name) for s in schemas])
+
+
+def decode_user_response(data: bytes) -> Optional[User]:
+    """Optional[:class:`User`]: Decodes raw response of `/profile` endpoint
+    straight into :class:`User`. If the user isn't found, then returns `None`
+    
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The body of the response"""
+    response: ResponseSchema = _RESPONSE_DECODER.decode(data)
+    if response.response_type == "NOT_FOUND":
+        return None
+
+    return _user(_USER_DECODER.decode(response.response))
+
+
+def decode_tops_response(data: bytes) -> Optional[TopLists]:
+    """Optional[:class:`TopLists`]: Decodes raw response of `/top` endpoint
+    straight into :class:`TopLists`. If the response isn't successful, then
+    returns `None`
+    
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The body of the response"""
+    response: ResponseSchema = _RESPONSE_DECODER.decode(data)
+    if response.response_type != "OK":
+        return None
+
+    schema: TopListsSchema = _TOPS_DECODER.decode(response.response)
+    return TopLists(_top("crystals", schema.crystals), _top("efficiency", schema.efficiency),
+                    _top("golds", schema.golds), _top("score", schema.score))
@@ -0,0 +1,325 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime as dt
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .client import Client as AsyncClient
+from .errors import UserNotFoundError
+from .types import (
+    Article,
+    ArticleComment,
+    ESportListResponse,
+    NodeChange,
+    StableServerStatus,
+    TestServerStatus,
+    TopLists,
+    User,
+)
+from .watermark import WatermarkStore
+
+__all__ = ("Client", "get_tops", "get_user", "get_users", "iter_users", "get_status", "get_test_status",
+           "watch_servers", "get_articles", "iter_articles", "sync_articles", "get_article_info",
+           "get_article_comments")
+
+T = TypeVar('T')
+
+
+class Client:
+    """The blocking client of Tanki Online's API for synchronous code
+
+    It runs one event loop in a background thread, and all the methods submit
+    requests to this loop and wait for their results. So the methods can be
+    called from many threads at the same time, and all of them share one
+    connection pool
+
+    Can be used as a context manager, which closes the client on exit. All the
+    methods do the same as module-level functions of :mod:`toapi.client` with
+    the same names
+    
+    Parameters
+    ----------
+    client: Optional[:class:`toapi.Client`]
+        The asynchronous client to run. It allows to configure cache, limiter
+        and other options. If `None`, then the client with default options is
+        created. By default, `None`
+
+    timeout: Optional[:class:`float`]
+        The maximum time (in seconds) to wait for result of every call. If
+        `None`, then it waits forever. By default, `None`"""
+
+    def __init__(self, client: Optional[AsyncClient] = None, *, timeout: Optional[float] = None) -> None:
+        self.client: AsyncClient = client or AsyncClient()
+        self.timeout: Optional[float] = timeout
+
+        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = threading.Thread(target=self._loop.run_forever, name="toapi-sync",
+                                                          daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(client={self.client!r}, closed={self.closed})"
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether this client is closed"""
+        return self._loop.is_closed()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        if self.closed or threading.current_thread() is self._thread:
+            # the coroutine is never run, so it's closed to not be reported as never awaited
+            coroutine.close()
+            if self.closed:
+                raise RuntimeError("The client is closed")
+
+            raise RuntimeError("Blocking calls can't be made from the loop of the client")
+
+        future: "Future[T]" = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+
+        except FutureTimeoutError:
+            # the coroutine is still running in the loop, so it must be stopped too
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Closes the HTTP session, stops the background loop and waits for its
+        thread to finish"""
+        if self.closed:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def get_tops(self) -> TopLists:
+        """List[:class:`Top`]: Gets list with tops of players. See :func:`toapi.get_tops`"""
+        return self._run(self.client.get_tops())
+
+    def get_user(self, name: str, *, lang: str = "en") -> User:
+        """:class:`User`: Tries to find user by the name. See :func:`toapi.get_user`"""
+        return self._run(self.client.get_user(name, lang=lang))
+
+    def get_users(
+        self,
+        names: Iterable[str],
+        *,
+        lang: str = "en",
+        concurrency: int = 10
+    ) -> List[Union[User, UserNotFoundError]]:
+        """List[Union[:class:`User`, :class:`UserNotFoundError`]]: Tries to find
+        many users at once. See :func:`toapi.get_users`"""
+        return self._run(self.client.get_users(names, lang=lang, concurrency=concurrency))
+
+    def iter_users(
+        self,
+        names: Iterable[str],
+        *,
+        lang: str = "en",
+        concurrency: int = 10
+    ) -> Iterator[Tuple[str, Union[User, UserNotFoundError]]]:
+        """Tuple[:class:`str`, Union[:class:`User`, :class:`UserNotFoundError`]]:
+        Tries to find many users at once and yields them as soon as they are
+        received. See :func:`toapi.iter_users`"""
+        return self._iterate(self.client.iter_users(names, lang=lang, concurrency=concurrency))
+
+    def _iterate(self, iterator: AsyncGenerator[T, None]) -> Iterator[T]:
+        """Iterator[T]: Yields items of the asynchronous iterator, which is run
+        in the loop of this client, and closes it, if the iteration is stopped"""
+        try:
+            while True:
+                try:
+                    yield self._run(_next(iterator))
+
+                except StopAsyncIteration:
+                    return
+
+        finally:
+            if not self.closed:
+                self._run(iterator.aclose())
+
+    def get_status(self) -> StableServerStatus:
+        """:class:`StableServerStatus`: Gets the status of stable game server.
+        See :func:`toapi.get_status`"""
+        return self._run(self.client.get_status())
+
+    def get_test_status(self, *, concurrency: int = 10, timeout: Optional[float] = 5.0) -> List[TestServerStatus]:
+        """List[:class:`TestServerStatus`]: Gets the status of test game servers.
+        See :func:`toapi.get_test_status`"""
+        return self._run(self.client.get_test_status(concurrency=concurrency, timeout=timeout))
+
+    def watch_servers(
+        self,
+        *,
+        interval: float = 30.0,
+        test: bool = True,
+        timeout: Optional[float] = 5.0
+    ) -> Iterator[List[NodeChange]]:
+        """List[:class:`NodeChange`]: Polls the status of game servers and yields
+        changes of their nodes. See :func:`toapi.watch_servers`"""
+        return self._iterate(self.client.watch_servers(interval=interval, test=test, timeout=timeout))
+
+    def get_articles(self, *, count: int = 20, page: int = 1) -> ESportListResponse[Article]:
+        """:class:`ESportListResponse`[:class:`Article`]: Tries to get list of eSport
+        articles. See :func:`toapi.get_articles`"""
+        return self._run(self.client.get_articles(count=count, page=page))
+
+    def iter_articles(self, *, count: int = 20, prefetch: int = 4, start: int = 1) -> Iterator[Article]:
+        """:class:`Article`: Yields all the eSport articles in order, requesting
+        next pages in advance. See :func:`toapi.iter_articles`"""
+        return self._iterate(self.client.iter_articles(count=count, prefetch=prefetch, start=start))
+
+    def sync_articles(
+        self,
+        *,
+        since_id: Optional[int] = None,
+        since_date: Optional[dt] = None,
+        store: Optional[WatermarkStore] = None,
+        key: str = "articles",
+        count: int = 20,
+        max_pages: Optional[int] = None
+    ) -> List[Article]:
+        """List[:class:`Article`]: Returns only the eSport articles, which are new
+        or changed since the watermark. See :func:`toapi.sync_articles`"""
+        return self._run(self.client.sync_articles(since_id=since_id, since_date=since_date, store=store, key=key,
+                                                   count=count, max_pages=max_pages))
+
+    def get_article_info(self, id: int) -> Article:
+        """:class:`Article`: Tries to get information about article with specified
+        ID. See :func:`toapi.get_article_info`"""
+        return self._run(self.client.get_article_info(id))
+
+    def get_article_comments(self, article_id: int) -> List[ArticleComment]:
+        """List[:class:`ArticleComment`]: Tries to get comments of article with
+        specified ID. See :func:`toapi.get_article_comments`"""
+        return self._run(self.client.get_article_comments(article_id))
+
+
+async def _next(iterator: AsyncIterator[T]) -> T:
+    """T: Returns the next item of the asynchronous iterator"""
+    return await iterator.__anext__()  # pylint: disable=C2801
+
+
+_DEFAULT: Optional[Client] = None
+_DEFAULT_LOCK: threading.Lock = threading.Lock()
+
+
+def _default() -> Client:
+    """:class:`Client`: Returns the client which is used by module-level
+    functions. It's created on the first call"""
+    global _DEFAULT  # pylint: disable=W0603
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None or _DEFAULT.closed:
+            _DEFAULT = Client()
+
+        return _DEFAULT
+
+
+def get_tops() -> TopLists:
+    """List[:class:`Top`]: Blocking version of :func:`toapi.get_tops`"""
+    return _default().get_tops()
+
+
+def get_user(name: str, *, lang: str = "en") -> User:
+    """:class:`User`: Blocking version of :func:`toapi.get_user`"""
+    return _default().get_user(name, lang=lang)
+
+
+def get_users(names: Iterable[str], *, lang: str = "en", concurrency: int = 10) -> List[Union[User, UserNotFoundError]]:
+    """List[Union[:class:`User`, :class:`UserNotFoundError`]]: Blocking version
+    of :func:`toapi.get_users`"""
+    return _default().get_users(names, lang=lang, concurrency=concurrency)
+
+
+def iter_users(
+    names: Iterable[str],
+    *,
+    lang: str = "en",
+    concurrency: int = 10
+) -> Iterator[Tuple[str, Union[User, UserNotFoundError]]]:
+    """Tuple[:class:`str`, Union[:class:`User`, :class:`UserNotFoundError`]]: Blocking
+    version of :func:`toapi.iter_users`"""
+    return _default().iter_users(names, lang=lang, concurrency=concurrency)
+
+
+def get_status() -> StableServerStatus:
+    """:class:`StableServerStatus`: Blocking version of :func:`toapi.get_status`"""
+    return _default().get_status()
+
+
+def get_test_status(*, concurrency: int = 10, timeout: Optional[float] = 5.0) -> List[TestServerStatus]:
+    """List[:class:`TestServerStatus`]: Blocking version of :func:`toapi.get_test_status`"""
+    return _default().get_test_status(concurrency=concurrency, timeout=timeout)
+
+
+def watch_servers(
+    *,
+    interval: float = 30.0,
+    test: bool = True,
+    timeout: Optional[float] = 5.0
+) -> Iterator[List[NodeChange]]:
+    """List[:class:`NodeChange`]: Blocking version of :func:`toapi.watch_servers`"""
+    return _default().watch_servers(interval=interval, test=test, timeout=timeout)
+
+
+def get_articles(*, count: int = 20, page: int = 1) -> ESportListResponse[Article]:
+    """:class:`ESportListResponse`[:class:`Article`]: Blocking version of
+    :func:`toapi.get_articles`"""
+    return _default().get_articles(count=count, page=page)
+
+
+def iter_articles(*, count: int = 20, prefetch: int = 4, start: int = 1) -> Iterator[Article]:
+    """:class:`Article`: Blocking version of :func:`toapi.iter_articles`"""
+    return _default().iter_articles(count=count, prefetch=prefetch, start=start)
+
+
+def sync_articles(
+    *,
+    since_id: Optional[int] = None,
+    since_date: Optional[dt] = None,
+    store: Optional[WatermarkStore] = None,
+    key: str = "articles",
+    count: int = 20,
+    max_pages: Optional[int] = None
+) -> List[Article]:
+    """List[:class:`Article`]: Blocking version of :func:`toapi.sync_articles`"""
+    return _default().sync_articles(since_id=since_id, since_date=since_date, store=store, key=key, count=count,
+                                    max_pages=max_pages)
+
+
+def get_article_info(id: int) -> Article:
+    """:class:`Article`: Blocking version of :func:`toapi.get_article_info`"""
+    return _default().get_article_info(id)
+
+
+def get_article_comments(article_id: int) -> List[ArticleComment]:
+    """List[:class:`ArticleComment`]: Blocking version of :func:`toapi.get_article_comments`"""
+    return _default().get_article_comments(article_id)
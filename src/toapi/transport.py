@@ -0,0 +1,291 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, AsyncContextManager, AsyncGenerator, AsyncIterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import BaseConnector, ClientResponse, ClientSession, ClientTimeout, TCPConnector, TraceConfig
+
+from .hooks import RequestTrace, current_trace
+
+__all__ = ("Transport", "TransportResponse", "AiohttpTransport")
+
+
+class TransportResponse(ABC):
+    """The base class for responses of transports
+    
+    Attributes
+    ----------
+    status: :class:`int`
+        The HTTP status of the response
+        
+    headers: Mapping[:class:`str`, :class:`str`]
+        The headers of the response
+        
+    content_length: Optional[:class:`int`]
+        The size (in bytes) of the body, if it's known"""
+
+    status: int
+    headers: Mapping[str, str]
+    content_length: Optional[int]
+
+    @abstractmethod
+    async def read(self) -> bytes:
+        """:class:`bytes`: Reads the whole body of the response"""
+
+    @abstractmethod
+    def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        """:class:`bytes`: Yields the body of the response by chunks
+        
+        Parameters
+        ----------
+        size: :class:`int`
+            The maximum size (in bytes) of one chunk"""
+
+
+class Transport(ABC):
+    """The base class for transports, which actually send requests of
+    :class:`HTTPClient`. Override it to send requests somewhere else than the
+    real API, for example, to a local server or recorded responses"""
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether this transport is closed"""
+        return False
+
+    @abstractmethod
+    def request(self, method: str, url: str) -> AsyncContextManager[TransportResponse]:
+        """AsyncContextManager[:class:`TransportResponse`]: Sends the request and
+        returns the context manager with its response. The response must be used
+        only inside this context
+        
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the request. For example, `GET`
+            
+        url: :class:`str`
+            The full URL of the request"""
+
+    async def close(self) -> None:
+        """Releases all resources of this transport"""
+
+
+class _AiohttpResponse(TransportResponse):
+    """The response of :class:`AiohttpTransport`"""
+
+    __slots__ = ("_response", "status", "headers", "content_length")
+
+    def __init__(self, response: ClientResponse) -> None:
+        self._response: ClientResponse = response
+        self.status = response.status
+        self.headers = response.headers
+        self.content_length = response.content_length
+
+    async def read(self) -> bytes:
+        return await self._response.read()
+
+    def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        return self._response.content.iter_chunked(size)
+
+
+class _AiohttpRequest:
+    """The context manager of the request of :class:`AiohttpTransport`"""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: Any) -> None:
+        self._context: Any = context
+
+    async def __aenter__(self) -> TransportResponse:
+        return _AiohttpResponse(await self._context.__aenter__())
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self._context.__aexit__(*args)
+
+
+async def _on_dns_start(_: ClientSession, context: SimpleNamespace, __: Any) -> None:
+    context.dns_started = time.perf_counter()
+
+
+async def _on_dns_end(_: ClientSession, context: SimpleNamespace, __: Any) -> None:
+    trace: Optional[RequestTrace] = current_trace()
+    if trace is not None:
+        trace.dns_time = time.perf_counter()-context.dns_started
+
+
+async def _on_connect_start(_: ClientSession, context: SimpleNamespace, __: Any) -> None:
+    context.connect_started = time.perf_counter()
+
+
+async def _on_connect_end(_: ClientSession, context: SimpleNamespace, __: Any) -> None:
+    trace: Optional[RequestTrace] = current_trace()
+    if trace is not None:
+        trace.connect_time = time.perf_counter()-context.connect_started
+
+
+def _trace_config() -> TraceConfig:
+    """:class:`aiohttp.TraceConfig`: Creates the config which writes times of
+    DNS resolving and connecting to the current :class:`RequestTrace`"""
+    config: TraceConfig = TraceConfig()
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connect_start)
+    config.on_connection_create_end.append(_on_connect_end)
+    return config
+
+
+class AiohttpTransport(Transport):
+    """The transport that owns a long-lived :class:`aiohttp.ClientSession` and
+    sends requests through its connection pool
+
+    The session is created lazily on the first request, so the object can be
+    created outside of a running event loop. If it isn't closed explicitly,
+    then it's closed when its loop is shut down by :func:`asyncio.run` or
+    :meth:`asyncio.AbstractEventLoop.shutdown_asyncgens`
+    
+    Parameters
+    ----------
+    limit_per_host: :class:`int`
+        The maximum count of simultaneous connections to one host. If `0`,
+        then it's unlimited. By default, `10`
+
+    keepalive_timeout: :class:`float`
+        The time (in seconds) during which an idle connection is kept alive.
+        By default, `30.0`
+
+    ttl_dns_cache: Optional[:class:`int`]
+        The time (in seconds) for which resolved DNS records are cached. If
+        `None`, then they are cached forever. By default, `300`
+
+    timeout: Optional[:class:`float`]
+        The total timeout (in seconds) of every request. If `None`, then
+        the default timeout of :mod:`aiohttp` is used. By default, `None`
+
+    origin: Optional[:class:`str`]
+        The origin (for example, `http://127.0.0.1:8080`) to which all the
+        requests are sent instead of hosts of their URLs. The path and query
+        are kept, and the original host is sent in `X-Forwarded-Host` header.
+        It's useful with :class:`toapi.fakeapi.FakeAPI`. By default, `None`"""
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[float] = None,
+        origin: Optional[str] = None
+    ) -> None:
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.timeout: Optional[float] = timeout
+        self.origin: Optional[str] = None if origin is None else origin.rstrip("/")
+
+        self._session: Optional[ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closer: Optional[AsyncGenerator[None, None]] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(limit_per_host={self.limit_per_host}, origin={self.origin!r})"
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether the session of this transport is closed or
+        isn't created yet"""
+        return self._session is None or self._session.closed
+
+    def _get_session(self) -> ClientSession:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        # the session is bound to the loop it was created in, so if that loop is gone
+        # (for example, after another `asyncio.run` call) the session is recreated
+        if self._session is not None and not self._session.closed and self._loop is not None:
+            _discard(self._session, self._loop)
+
+        connector: TCPConnector = TCPConnector(limit_per_host=self.limit_per_host,
+                                               keepalive_timeout=self.keepalive_timeout,
+                                               ttl_dns_cache=self.ttl_dns_cache)
+        timeout: ClientTimeout = ClientTimeout(total=self.timeout) if self.timeout is not None else ClientTimeout()
+        self._session = ClientSession(connector=connector, timeout=timeout, trace_configs=[_trace_config()])
+        self._loop = loop
+        self._closer = _close_on_shutdown(self._session)
+        return self._session
+
+    def request(self, method: str, url: str) -> AsyncContextManager[TransportResponse]:
+        if self.origin is None:
+            return _AiohttpRequest(self._get_session().request(method, url))
+
+        # the original host is forwarded, so the server can tell apart hosts with the same paths
+        parts = urlsplit(url)
+        url = self.origin + parts.path + (f"?{parts.query}" if parts.query else "")
+        return _AiohttpRequest(self._get_session().request(method, url, headers={"X-Forwarded-Host": parts.netloc}))
+
+    async def close(self) -> None:
+        """Closes the session of this transport and all its pooled connections"""
+        session: Optional[ClientSession] = self._session
+        loop: Optional[asyncio.AbstractEventLoop] = self._loop
+        closer: Optional[AsyncGenerator[None, None]] = self._closer
+        self._session, self._loop, self._closer = None, None, None
+        if session is None or session.closed:
+            return
+
+        if loop is not asyncio.get_running_loop() and loop is not None:
+            _discard(session, loop)
+
+        elif closer is not None:
+            # the generator closes the session, and it mustn't be finalized by the loop later
+            await closer.aclose()
+
+        else:
+            await session.close()
+
+
+def _close_on_shutdown(session: ClientSession) -> AsyncGenerator[None, None]:
+    """AsyncGenerator[`None`, `None`]: Starts the generator, which closes the
+    session, when it's finalized. It's left suspended, so the loop finalizes it
+    on shutdown (for example, at the end of :func:`asyncio.run`), while the
+    connections of the session still can be closed"""
+    async def closer() -> AsyncGenerator[None, None]:
+        try:
+            yield
+
+        finally:
+            await session.close()
+
+    generator: AsyncGenerator[None, None] = closer()
+    try:
+        # the first step only reaches `yield`, so it's done without the loop
+        generator.asend(None).send(None)
+
+    except StopIteration:
+        pass
+
+    return generator
+
+
+def _discard(session: ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+    """Closes the session of another event loop, so it isn't reported as unclosed"""
+    if loop.is_running():
+        # its connections can be used only in their own loop, which runs in another thread
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+
+    # nothing would run the coroutine in the stopped or closed loop, so the connections
+    # are closed right away
+    connector: Optional[BaseConnector] = session.connector
+    session.detach()
+    if connector is not None:
+        connector._close()  # pylint: disable=W0212
@@ -8,11 +8,12 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 
 # pylint: disable=C0103
 
+import os
 from dataclasses import dataclass
 from datetime import datetime as dt
-from typing import Any, List, Mapping, Optional, Type
+from typing import IO, Any, AsyncIterator, List, Mapping, Optional, Type, Union
 
-from ..http import request
+from ..http import HTTPClient, default_http, request
 
 __all__ = ("Article", "ArticleAuthor", "ArticleCategory", "ArticleComment")
 
@@ -73,6 +74,9 @@ class Article:
         The array with comments at the article. If isn't provided by API, then
         it's `None`"""
 
+    __slots__ = ("id", "author", "views", "category", "categories", "title", "short_desc", "image", "wide_image",
+                 "status", "type", "date", "list_order", "content", "comments")
+
     id: int
     author: "ArticleAuthor"
     views: int
@@ -145,6 +149,118 @@ class Article:
         reads data of this image and returns it"""
         return None if self.wide_image is None else await request("GET", self.wide_image, base="", bytes=True)
 
+    async def iter_image(
+        self,
+        *,
+        chunk_size: int = 65536,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> AsyncIterator[bytes]:
+        """:class:`bytes`: If the article contains an image, then streams data of
+        this image by chunks, otherwise yields nothing
+        
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum size (in bytes) of one chunk. By default, `65536`
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        if self.image is not None:
+            client: HTTPClient = http or default_http()
+            async for chunk in client.stream(self.image, chunk_size=chunk_size, max_bytes=max_bytes):
+                yield chunk
+
+    async def iter_wide_image(
+        self,
+        *,
+        chunk_size: int = 65536,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> AsyncIterator[bytes]:
+        """:class:`bytes`: If the article contains a wide image, then streams data
+        of this image by chunks, otherwise yields nothing
+        
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum size (in bytes) of one chunk. By default, `65536`
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        if self.wide_image is not None:
+            client: HTTPClient = http or default_http()
+            async for chunk in client.stream(self.wide_image, chunk_size=chunk_size, max_bytes=max_bytes):
+                yield chunk
+
+    async def save_image(
+        self,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> Optional[int]:
+        """Optional[:class:`int`]: If the article contains an image, then streams
+        data of this image to file and returns its size (in bytes)
+        
+        Parameters
+        ----------
+        destination: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+            The path to the file or the binary file-like object
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        if self.image is None:
+            return None
+
+        return await (http or default_http()).download(self.image, destination, max_bytes=max_bytes)
+
+    async def save_wide_image(
+        self,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> Optional[int]:
+        """Optional[:class:`int`]: If the article contains a wide image, then
+        streams data of this image to file and returns its size (in bytes)
+        
+        Parameters
+        ----------
+        destination: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+            The path to the file or the binary file-like object
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        if self.wide_image is None:
+            return None
+
+        return await (http or default_http()).download(self.wide_image, destination, max_bytes=max_bytes)
+
 
 @dataclass
 class ArticleAuthor:
@@ -158,6 +274,8 @@ class ArticleAuthor:
     name: :class:`str`
         The name of the author"""
 
+    __slots__ = ("id", "name")
+
     id: int
     name: str
 
@@ -199,6 +317,8 @@ class ArticleCategory:
     status: Optional[:class:`int`]
         The status of the category"""
 
+    __slots__ = ("id", "name", "lang", "sort_order", "status")
+
     id: int
     name: str
     lang: str
@@ -273,6 +393,9 @@ class ArticleComment:
         The exact date and time the comment was updated. If isn't provided by API,
         then it's `None`"""
 
+    __slots__ = ("id", "commentable_type", "commentable_id", "parent_id", "text", "is_approved", "user_id",
+                 "created_at", "updated_at")
+
     id: int
     commentable_type: str
     commentable_id: int
@@ -35,6 +35,8 @@ class ESportListResponse(Generic[T]):
     total: :class:`int`
         Total number of elements in pagination"""
 
+    __slots__ = ("data", "page", "last_page", "per_page", "total")
+
     data: List[T]
     page: int
     last_page: int
@@ -8,11 +8,13 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 
 # pylint: disable=C0103
 
+import os
 from dataclasses import dataclass
 from datetime import timedelta as td
-from typing import Any, List, Mapping, Optional, Type
+from sys import intern
+from typing import IO, Any, AsyncIterator, List, Mapping, Optional, Type, Union
 
-from ..http import request
+from ..http import HTTPClient, default_http, request
 
 __all__ = ("GameObject", "SuppliesObject")
 
@@ -33,6 +35,8 @@ class BaseGameObject:
     name: :class:`str`
         The name of the object"""
 
+    __slots__ = ("id", "image", "name")
+
     id: int
     image: str
     name: str
@@ -50,6 +54,58 @@ class BaseGameObject:
         """:class:`bytes`: Reads the image data of this object and returns it"""
         return await request("GET", self.image, base="", bytes=True)
 
+    async def iter_image(
+        self,
+        *,
+        chunk_size: int = 65536,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> AsyncIterator[bytes]:
+        """:class:`bytes`: Streams the image data of this object by chunks, so it
+        isn't fully kept in memory
+        
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum size (in bytes) of one chunk. By default, `65536`
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        client: HTTPClient = http or default_http()
+        async for chunk in client.stream(self.image, chunk_size=chunk_size, max_bytes=max_bytes):
+            yield chunk
+
+    async def save_image(
+        self,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        max_bytes: Optional[int] = None,
+        http: Optional[HTTPClient] = None
+    ) -> int:
+        """:class:`int`: Streams the image data of this object to file and returns
+        its size (in bytes)
+        
+        Parameters
+        ----------
+        destination: Union[:class:`str`, :class:`os.PathLike`, IO[:class:`bytes`]]
+            The path to the file or the binary file-like object
+            
+        max_bytes: Optional[:class:`int`]
+            The maximum allowed size (in bytes) of the image. If `None`, then it's
+            unlimited. By default, `None`
+
+        http: Optional[:class:`HTTPClient`]
+            The HTTP client which makes the request, for example,
+            :attr:`Client.http`. If `None`, then the default one is used (see
+            :func:`default_http`). By default, `None`"""
+        return await (http or default_http()).download(self.image, destination, max_bytes=max_bytes)
+
 
 @dataclass
 class GameObject(BaseGameObject):
@@ -82,6 +138,8 @@ class GameObject(BaseGameObject):
     time_played: :class:`timedelta`
         The time in the game that was spent with these objects"""
 
+    __slots__ = ("grade", "properties", "score_earned", "time_played")
+
     grade: int
     properties: Optional[List[str]]
     score_earned: int
@@ -95,14 +153,31 @@ class GameObject(BaseGameObject):
         ----------
         data: Mapping[:class:`str`, :class:`Any`]
             The JSON data"""
+        return cls._from_fields(data["grade"], data["id"], data["imageUrl"], data["name"], data["properties"],
+                                data["scoreEarned"], data["timePlayed"])
+
+    @classmethod
+    def _from_fields(
+        cls: Type["GameObject"],
+        grade: int,
+        id: int,
+        image: str,
+        name: str,
+        properties: Optional[List[str]],
+        score_earned: int,
+        time_played: float
+    ) -> "GameObject":
+        """:class:`GameObject`: Builds the object from values of its JSON fields.
+        It's shared by :meth:`from_json` and :mod:`toapi.schemas`, so both ways of
+        decoding convert the values the same"""
         self = cls.__new__(cls)
-        self.grade = data["grade"] + 1
-        self.id = data["id"]
-        self.image = data["imageUrl"]
-        self.name = data["name"]
-        self.properties = data["properties"]
-        self.score_earned = data["scoreEarned"]
-        self.time_played = td(seconds=data["timePlayed"])
+        self.grade = grade + 1
+        self.id = id
+        self.image = intern(image)
+        self.name = intern(name)
+        self.properties = properties
+        self.score_earned = score_earned
+        self.time_played = td(seconds=time_played)
         return self
 
     @staticmethod
@@ -135,6 +210,8 @@ class SuppliesObject(BaseGameObject):
     usages: :class:`int`
         The count of these supplies usages"""
 
+    __slots__ = ("usages",)
+
     usages: int
 
     @classmethod
@@ -145,11 +222,17 @@ class SuppliesObject(BaseGameObject):
         ----------
         data: Mapping[:class:`str`, :class:`Any`]
             The JSON data"""
+        return cls._from_fields(data["id"], data["imageUrl"], data["name"], data["usages"])
+
+    @classmethod
+    def _from_fields(cls: Type["SuppliesObject"], id: int, image: str, name: str, usages: int) -> "SuppliesObject":
+        """:class:`SuppliesObject`: Builds the supplies from values of their JSON
+        fields. See :meth:`GameObject._from_fields`"""
         self = cls.__new__(cls)
-        self.id = data["id"]
-        self.image = data["imageUrl"]
-        self.name = data["name"]
-        self.usages = data["usages"]
+        self.id = id
+        self.image = intern(image)
+        self.name = intern(name)
+        self.usages = usages
         return self
 
     @staticmethod
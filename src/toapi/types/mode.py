@@ -8,6 +8,7 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 
 from dataclasses import dataclass
 from datetime import timedelta as td
+from sys import intern
 from typing import Any, List, Mapping, Type
 
 __all__ = ("Mode",)
@@ -32,6 +33,8 @@ class Mode:
     type: :class:`str`
         The short name of the mode"""
 
+    __slots__ = ("name", "score_earned", "time_played", "type")
+
     name: str
     score_earned: int
     time_played: td
@@ -54,11 +57,17 @@ class Mode:
         ----------
         data: Mapping[:class:`str`, :class:`Any`]
             The JSON data"""
+        return cls._from_fields(data["name"], data["scoreEarned"], data["timePlayed"], data["type"])
+
+    @classmethod
+    def _from_fields(cls: Type["Mode"], name: str, score_earned: int, time_played: float, type: str) -> "Mode":
+        """:class:`Mode`: Builds the mode from values of its JSON fields. It's
+        shared by :meth:`from_json` and :mod:`toapi.schemas`"""
         self = cls.__new__(cls)
-        self.name = data["name"]
-        self.score_earned = data["scoreEarned"]
-        self.time_played = td(seconds=data["timePlayed"])
-        self.type = data["type"]
+        self.name = intern(name)
+        self.score_earned = score_earned
+        self.time_played = td(seconds=time_played)
+        self.type = intern(type)
         return self
 
     @staticmethod
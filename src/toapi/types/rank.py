@@ -7,9 +7,10 @@ The above copyright notice and this permission notice shall be included in all c
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
 from dataclasses import dataclass
-from typing import Union
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
-from ..data import get_rank_name
+from ..data import get_language, get_rank_name
 
 __all__ = ("Rank",)
 
@@ -24,8 +25,13 @@ class Rank:
         The player's rank as number. Has the value from `1` to `31+N`,
         where `N` is :attr:`legend_number`"""
 
+    __slots__ = ("number", "_names")
+
     number: int
 
+    def __post_init__(self) -> None:
+        self._names: Dict[str, str] = {}
+
     @property
     def legend_number(self) -> int:
         """:class:`int`: If the player has the `Legend` rank, then returns
@@ -34,8 +40,28 @@ class Rank:
 
     @property
     def name(self) -> str:
-        """:class:`str`: The name of player's rank"""
-        return get_rank_name(self.number)
+        """:class:`str`: The name of player's rank in the language of the
+        current context (see :func:`toapi.data.language`). It's computed once
+        for every language"""
+        lang: str = get_language()
+        name: Optional[str] = self._names.get(lang)
+        if name is None:
+            name = self._names[lang] = get_rank_name(self.number, lang)
+
+        return name
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def shared(number: int) -> "Rank":
+        """:class:`Rank`: Returns the instance of rank with this number, which is
+        shared between all the users, so thousands of them don't keep thousands
+        of equal ranks. The shared instance must not be changed
+
+        Parameters
+        ----------
+        number: :class:`int`
+            The number of the rank"""
+        return Rank(number)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(number={self.number})"
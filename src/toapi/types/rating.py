@@ -25,6 +25,8 @@ class Rating:
         The value of characteristic of the player, according to which the
         top was compiled"""
 
+    __slots__ = ("position", "value")
+
     position: int
     value: int
 
@@ -56,6 +58,8 @@ class Ratings:
     score: Optional[:class:`Rating`]
         The rating by the score"""
 
+    __slots__ = ("crystals", "efficiency", "golds", "score")
+
     crystals: Optional[Rating]
     efficiency: Optional[Rating]
     golds: Optional[Rating]
@@ -69,9 +73,24 @@ class Ratings:
         ----------
         data: Mapping[:class:`str`, :class:`Any`]
             The original data of ratings"""
+        return cls._from_fields(Rating(**data["crystals"]) if data["crystals"] is not None else None,
+                                Rating(**data["efficiency"]) if data["efficiency"] is not None else None,
+                                Rating(**data["golds"]) if data["golds"] is not None else None,
+                                Rating(**data["score"]) if data["score"] is not None else None)
+
+    @classmethod
+    def _from_fields(
+        cls: Type["Ratings"],
+        crystals: Optional[Rating],
+        efficiency: Optional[Rating],
+        golds: Optional[Rating],
+        score: Optional[Rating]
+    ) -> "Ratings":
+        """:class:`Ratings`: Builds the ratings from already built values of JSON
+        fields. It's shared by :meth:`from_json` and :mod:`toapi.schemas`"""
         self = cls.__new__(cls)
-        self.crystals = Rating(**data["crystals"]) if data["crystals"] is not None else None
-        self.efficiency = Rating(**data["efficiency"]) if data["efficiency"] is not None else None
-        self.golds = Rating(**data["golds"]) if data["golds"] is not None else None
-        self.score = Rating(**data["score"]) if data["score"] is not None else None
+        self.crystals = crystals
+        self.efficiency = efficiency
+        self.golds = golds
+        self.score = score
         return self
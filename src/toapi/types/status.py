@@ -7,12 +7,11 @@ The above copyright notice and this permission notice shall be included in all c
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
 from dataclasses import dataclass
-from locale import getlocale
 from typing import Any, List, Mapping, Optional, Tuple, Type
 
-from ..data import build_test_url
+from ..data import build_test_url, get_language
 
-__all__ = ("StableServerStatus", "TestServerStatus", "ServerNode")
+__all__ = ("StableServerStatus", "TestServerStatus", "ServerNode", "NodeChange")
 
 
 @dataclass
@@ -33,6 +32,8 @@ class StableServerStatus:
     nodes: List[:class:`ServerNode`]
         The list with nodes of the server"""
 
+    __slots__ = ("apk_link", "supported_android", "nodes")
+
     apk_link: Optional[str]
     supported_android: Tuple[int, ...]
     nodes: List["ServerNode"]
@@ -77,13 +78,22 @@ class TestServerStatus:
         The count of the users at test server
         
     nodes: List[:class:`ServerNode`]
-        The array with nodes of the server"""
+        The array with nodes of the server
+
+    error: Optional[:class:`Exception`]
+        The error of receiving nodes from the balancer of this server. If it
+        isn't `None`, then :attr:`nodes` is empty"""
+
+    __slots__ = ("release", "domain", "user_count", "nodes", "error")
 
     release: str
     domain: str
     user_count: int
     nodes: List["ServerNode"]
 
+    def __post_init__(self) -> None:
+        self.error: Optional[Exception] = None
+
     @property
     def html_url(self) -> str:
         """:class:`str`: The url to HTML5 version of test server"""
@@ -91,8 +101,9 @@ class TestServerStatus:
 
     @property
     def flash_url(self) -> str:
-        """:class:`str`: The url to Flash version of test server"""
-        return build_test_url("flash", domain=self.domain, lang=("ru" if getlocale()[0] == "Russian_Russia" else "en"))
+        """:class:`str`: The url to Flash version of test server in the language
+        of the current context (see :func:`toapi.data.language`)"""
+        return build_test_url("flash", domain=self.domain, lang=get_language())
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(release={self.release!r}, domain={self.domain!r}; {len(self.nodes)} nodes)"
@@ -107,7 +118,9 @@ class TestServerStatus:
     def from_json(
         cls: Type["TestServerStatus"],
         data: Mapping[str, Any],
-        nodes: Mapping[str, Mapping[str, Any]]
+        nodes: Mapping[str, Mapping[str, Any]],
+        *,
+        error: Optional[Exception] = None
     ) -> "TestServerStatus":
         """:class:`TestServerStatus`: Converts JSON data to :class:`TestServerStatus`
         
@@ -117,12 +130,16 @@ class TestServerStatus:
             The JSON data
             
         nodes: Mapping[:class:`str`, Mapping[:class:`str`, :class:`Any`]]
-            The array with nodes of test server"""
+            The array with nodes of test server
+
+        error: Optional[:class:`Exception`]
+            The error of receiving nodes from the balancer. By default, `None`"""
         self = cls.__new__(cls)
         self.release = data["Release"]
         self.domain = data["Domain"]
         self.user_count = data["UserCount"]
         self.nodes = [ServerNode.from_json(v, name=k) for k, v in nodes.items()]
+        self.error = error
         return self
 
 
@@ -156,6 +173,8 @@ class ServerNode:
     partners: Mapping[:class:`str`, :class:`Any`]
         I don't know what is.... Sorry"""
 
+    __slots__ = ("name", "host", "status", "tcp_ports", "ws_ports", "inbattles", "online", "partners")
+
     name: str
     host: str
     status: str
@@ -195,3 +214,94 @@ class ServerNode:
         self.online = data["online"]
         self.partners = data["partners"]
         return self
+
+
+@dataclass
+class NodeChange:
+    """The dataclass for changes of one server node between two polls (see
+    :func:`toapi.watch_servers`)
+
+    Attributes
+    ----------
+    server: :class:`str`
+        The server of the node: `stable` or release of the test server
+
+    name: :class:`str`
+        The name of the node
+
+    before: Optional[:class:`ServerNode`]
+        The node at the previous poll. If `None`, then the node is added
+
+    after: Optional[:class:`ServerNode`]
+        The node at this poll. If `None`, then the node is removed"""
+
+    __slots__ = ("server", "name", "before", "after")
+
+    server: str
+    name: str
+    before: Optional[ServerNode]
+    after: Optional[ServerNode]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(server={self.server!r}, name={self.name!r}, kind={self.kind!r})"
+
+    def __str__(self) -> str:
+        return f"{self.server}/{self.name}"
+
+    @property
+    def kind(self) -> str:
+        """:class:`str`: The kind of the change: `added`, `removed` or
+        `changed`"""
+        if self.before is None:
+            return "added"
+
+        return "removed" if self.after is None else "changed"
+
+    @property
+    def status_changed(self) -> bool:
+        """:class:`bool`: Whether the status of the node was changed. For added
+        and removed nodes, it's `False`"""
+        return self.before is not None and self.after is not None and self.before.status != self.after.status
+
+    @property
+    def online_delta(self) -> int:
+        """:class:`int`: The change of count of players online. For added node,
+        it's its count, and for removed one, it's negative count"""
+        return (0 if self.after is None else self.after.online)-(0 if self.before is None else self.before.online)
+
+    @property
+    def inbattles_delta(self) -> int:
+        """:class:`int`: The change of count of players in battles, like
+        :attr:`online_delta`"""
+        return (0 if self.after is None else self.after.inbattles) - \
+            (0 if self.before is None else self.before.inbattles)
+
+    @classmethod
+    def diff(
+        cls: Type["NodeChange"],
+        server: str,
+        before: Mapping[str, ServerNode],
+        after: Mapping[str, ServerNode]
+    ) -> List["NodeChange"]:
+        """List[:class:`NodeChange`]: Compares nodes of the server by their names
+        and returns changes of added and removed nodes and nodes, whose status
+        or counts of players are changed
+
+        Parameters
+        ----------
+        server: :class:`str`
+            The server of the nodes
+
+        before: Mapping[:class:`str`, :class:`ServerNode`]
+            The nodes at the previous poll by their names
+
+        after: Mapping[:class:`str`, :class:`ServerNode`]
+            The nodes at this poll by their names"""
+        changes: List[NodeChange] = []
+        for name, node in after.items():
+            old: Optional[ServerNode] = before.get(name)
+            if old is None or (old.status, old.online, old.inbattles) != (node.status, node.online, node.inbattles):
+                changes.append(cls(server, name, old, node))
+
+        changes += [cls(server, name, node, None) for name, node in before.items() if name not in after]
+        return changes
@@ -7,16 +7,24 @@ The above copyright notice and this permission notice shall be included in all c
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Sequence, Type
+from typing import Any, Dict, Final, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
-from .user import TopListUser
+from .rank import Rank
+from .user import PartialUser, TopListUser
 
 __all__ = ("Top", "TopLists")
 
+TOPS: Final[Tuple[str, ...]] = ("crystals", "efficiency", "golds", "score")
+
 
 @dataclass
 class Top:
     """The dataclass for the toplists
+
+    The index of players by name is built once on the first lookup, so
+    :meth:`position`, :meth:`get` and `in` don't scan the list, and tops,
+    which aren't searched, don't keep it. If :attr:`users` is changed after
+    the lookup, then the index isn't updated
     
     Attributes
     ----------
@@ -26,9 +34,20 @@ class Top:
     users: List[:class:`TopListUser`]
         The list with users in a top"""
 
+    __slots__ = ("name", "users", "_positions")
+
     name: str
     users: List[TopListUser]
 
+    def __post_init__(self) -> None:
+        self._positions: Optional[Dict[str, int]] = None
+
+    def __contains__(self, user: Union[str, PartialUser]) -> bool:
+        return (user if isinstance(user, str) else user.name) in self._index()
+
+    def __len__(self) -> int:
+        return len(self.users)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name})"
 
@@ -53,12 +72,50 @@ class Top:
         self = cls.__new__(cls)
         self.name = name
         self.users = [TopListUser.from_json(u, top=name) for u in value]
+        self.__post_init__()
         return self
 
+    def position(self, name: str) -> Optional[int]:
+        """Optional[:class:`int`]: Returns the position (from `1`) of the player
+        in this top. If the player isn't in it, then returns `None`
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the player"""
+        return self._index().get(name)
+
+    def get(self, name: str) -> Optional[TopListUser]:
+        """Optional[:class:`TopListUser`]: Returns the player from this top by
+        the name. If the player isn't in it, then returns `None`
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the player"""
+        position: Optional[int] = self._index().get(name)
+        return None if position is None else self.users[position-1]
+
+    def _index(self) -> Dict[str, int]:
+        """Dict[:class:`str`, :class:`int`]: Returns the index of positions by
+        names of players, building it on the first call"""
+        if self._positions is None:
+            self._positions = {}
+            for position, user in enumerate(self.users, 1):
+                # if the player somehow appears twice, then the higher position is kept
+                self._positions.setdefault(user.name, position)
+
+        return self._positions
+
 
 @dataclass
 class TopLists:
     """The dataclass of object with the toplists
+
+    On the first lookup, the combined index of players (name to positions in
+    every top) and buckets of players by rank are built, so lookups and joins
+    across the tops don't scan them, and tops, which are only iterated, don't
+    keep them
     
     Attributes
     ----------
@@ -74,11 +131,50 @@ class TopLists:
     score: :class:`Top`
         The top-list of players by score"""
 
+    __slots__ = ("crystals", "efficiency", "golds", "score", "_players", "_ranks")
+
     crystals: Top
     efficiency: Top
     golds: Top
     score: Top
 
+    def __post_init__(self) -> None:
+        self._players: Optional[Dict[str, Dict[str, int]]] = None
+        self._ranks: Dict[int, List[str]] = {}
+
+    def __contains__(self, user: Union[str, PartialUser]) -> bool:
+        return (user if isinstance(user, str) else user.name) in self._index()
+
+    def _index(self) -> Dict[str, Dict[str, int]]:
+        """Dict[:class:`str`, Dict[:class:`str`, :class:`int`]]: Returns the
+        index of positions by names of players, building it and buckets of ranks
+        on the first call"""
+        if self._players is None:
+            self._players = {}
+            for top in self.tops:
+                for position, user in enumerate(top.users, 1):
+                    positions: Optional[Dict[str, int]] = self._players.get(user.name)
+                    if positions is None:
+                        positions = self._players[user.name] = {}
+                        self._ranks.setdefault(user.rank.number, []).append(user.name)
+
+                    positions.setdefault(top.name, position)
+
+        return self._players
+
+    @property
+    def tops(self) -> Tuple[Top, Top, Top, Top]:
+        """Tuple[:class:`Top`, ...]: All the tops in order: crystals, efficiency,
+        golds and score"""
+        return (self.crystals, self.efficiency, self.golds, self.score)
+
+    @property
+    def players(self) -> Mapping[str, Mapping[str, int]]:
+        """Mapping[:class:`str`, Mapping[:class:`str`, :class:`int`]]: The mapping
+        where key is name of the player and value is mapping of names of tops,
+        in which this player is, to positions. It must not be changed"""
+        return self._index()
+
     @classmethod
     def from_json(cls: Type["TopLists"], data: Mapping[str, Any]) -> "TopLists":
         """:class:`Top`: Converts JSON data to :class:`Top`
@@ -88,8 +184,90 @@ class TopLists:
         data: Mapping[:class:`str`, :class:`Any`]
             The JSON data"""
         self = cls.__new__(cls)
-        self.crystals = Top("crystals", data["crystals"])
-        self.efficiency = Top("efficiency", data["efficiency"])
-        self.golds = Top("golds", data["golds"])
-        self.score = Top("score", data["score"])
+        self.crystals = Top.from_json("crystals", data["crystals"])
+        self.efficiency = Top.from_json("efficiency", data["efficiency"])
+        self.golds = Top.from_json("golds", data["golds"])
+        self.score = Top.from_json("score", data["score"])
+        self.__post_init__()
         return self
+
+    def positions(self, name: str) -> Mapping[str, int]:
+        """Mapping[:class:`str`, :class:`int`]: Returns positions of the player
+        in the tops, where key is name of the top. If the player isn't in any
+        top, then it's empty
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the player"""
+        return self._index().get(name, {})
+
+    def with_rank(self, rank: Union[int, Rank]) -> List[str]:
+        """List[:class:`str`]: Returns names of the players with the rank, who
+        are in any top
+
+        Parameters
+        ----------
+        rank: Union[:class:`int`, :class:`Rank`]
+            The rank or its number"""
+        self._index()
+        return list(self._ranks.get(rank if isinstance(rank, int) else rank.number, ()))
+
+    def _resolve(self, tops: Sequence[str]) -> Tuple[Top, ...]:
+        unknown: List[str] = [t for t in tops if t not in TOPS]
+        if unknown:
+            raise ValueError(f"Unknown tops: {', '.join(unknown)}, must be from: {', '.join(TOPS)}")
+
+        return tuple(getattr(self, t) for t in tops or TOPS)
+
+    def intersection(self, *tops: str) -> List[str]:
+        """List[:class:`str`]: Returns names of the players, who are in all the
+        specified tops, in order of the first one, without repeats. For example,
+        `tops.intersection("crystals", "score")`
+
+        Parameters
+        ----------
+        *tops: :class:`str`
+            The names of the tops. If not specified, then all the tops are used
+
+        Raises
+        ------
+        :class:`ValueError`
+            If some top is unknown"""
+        resolved: Tuple[Top, ...] = self._resolve(tops)
+        names: List[str] = [t.name for t in resolved]
+        players: Dict[str, Dict[str, int]] = self._index()
+        # a player, who appears in the first top twice, is returned once
+        return [n for n in dict.fromkeys(u.name for u in resolved[0].users) if all(t in players[n] for t in names)]
+
+    def join(self, *tops: str, how: str = "inner") -> Dict[str, Tuple[Optional[TopListUser], ...]]:
+        """Dict[:class:`str`, Tuple[Optional[:class:`TopListUser`], ...]]: Joins
+        the tops by names of the players. The value is tuple with the player in
+        every specified top or `None`, if the player isn't in it
+
+        Parameters
+        ----------
+        *tops: :class:`str`
+            The names of the tops. If not specified, then all the tops are used
+
+        how: :class:`str`
+            If `inner`, then only the players, who are in all the tops, are
+            returned. If `outer`, then the players, who are in any of them. By
+            default, `inner`
+
+        Raises
+        ------
+        :class:`ValueError`
+            If some top is unknown or :param:`how` isn't `inner` or `outer`"""
+        if how not in ("inner", "outer"):
+            raise ValueError("Value of \"how\" parameter must be \"inner\" or \"outer\"")
+
+        resolved: Tuple[Top, ...] = self._resolve(tops)
+        names: List[str] = [t.name for t in resolved]
+        output: Dict[str, Tuple[Optional[TopListUser], ...]] = {}
+        for name, positions in self._index().items():
+            found: List[Optional[int]] = [positions.get(n) for n in names]
+            if how == "outer" and any(p is not None for p in found) or None not in found:
+                output[name] = tuple(None if p is None else t.users[p-1] for t, p in zip(resolved, found))
+
+        return output
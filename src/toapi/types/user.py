@@ -7,7 +7,7 @@ The above copyright notice and this permission notice shall be included in all c
 THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
 
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Type
+from typing import Any, Callable, Dict, Final, List, Mapping, Tuple, Type
 
 from .game_object import GameObject, SuppliesObject
 from .mode import Mode
@@ -16,6 +16,19 @@ from .rating import Ratings
 
 __all__ = ("PartialUser", "TopListUser", "User")
 
+# attributes of lazy users, which are built on the first access: name -> (JSON key, converter)
+LAZY_FIELDS: Final[Dict[str, Tuple[str, Callable[[Any], Any]]]] = {
+    "drones_played": ("dronesPlayed", GameObject.from_list),
+    "hulls_played": ("hullsPlayed", GameObject.from_list),
+    "modes_played": ("modesPlayed", Mode.from_list),
+    "paints_played": ("paintsPlayed", GameObject.from_list),
+    "previous_rating": ("previousRating", Ratings.from_json),
+    "rating": ("rating", Ratings.from_json),
+    "resistance_modules": ("resistanceModules", GameObject.from_list),
+    "supplies_usage": ("suppliesUsage", SuppliesObject.from_list),
+    "turrets_played": ("turretsPlayed", GameObject.from_list)
+}
+
 
 @dataclass
 class PartialUser:
@@ -32,6 +45,8 @@ class PartialUser:
     premium: :class:`bool`
         Whether this player has a premium"""
 
+    __slots__ = ("name", "rank", "premium")
+
     name: str
     rank: Rank
     premium: bool
@@ -74,6 +89,8 @@ class TopListUser(PartialUser):
         The value of the characteristic of this player, according to which
         the :attr:`top` was compiled"""
 
+    __slots__ = ("top", "top_value")
+
     top: str
     top_value: int
 
@@ -88,12 +105,18 @@ class TopListUser(PartialUser):
             
         top: :class:`str`
             The name of the top which this player from"""
+        return cls._from_fields(data["uid"], data["rank"], data["hasPremium"], data["value"], top)
+
+    @classmethod
+    def _from_fields(cls: Type["TopListUser"], uid: str, rank: int, premium: bool, value: int, top: str) -> "TopListUser":
+        """:class:`TopListUser`: Builds the player from values of JSON fields. It's
+        shared by :meth:`from_json` and :mod:`toapi.schemas`"""
         self = cls.__new__(cls)
-        self.name = data["uid"]
-        self.rank = Rank(data["rank"])
-        self.premium = data["hasPremium"]
+        self.name = uid
+        self.rank = Rank.shared(rank)
+        self.premium = premium
         self.top = top
-        self.top_value = data["value"]
+        self.top_value = value
         return self
 
 
@@ -172,6 +195,11 @@ class User(PartialUser):
     turrets_played: List[:class:`GameObject`]
         The list of turrets which the player is played on"""
 
+    __slots__ = ("kills", "deaths", "caught_golds", "drones_played", "crystals", "gear_score", "hulls_played",
+                 "modes_played", "mounted", "paints_played", "presents", "previous_rating", "rating",
+                 "resistance_modules", "score", "score_base", "score_next", "supplies_usage", "turrets_played",
+                 "_raw")
+
     kills: int
     deaths: int
     caught_golds: int
@@ -197,35 +225,106 @@ class User(PartialUser):
         """:class:`float`: Kill/death ratio of this player. The bigger, the better"""
         return round(self.kills/self.deaths, 2)
 
+    def __getattr__(self, name: str) -> Any:
+        # it's called only if the attribute isn't set, that's, the user is lazy and
+        # this collection isn't built yet
+        field: Any = LAZY_FIELDS.get(name)
+        if field is None:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        try:
+            raw: Dict[str, Any] = self._raw
+
+        except AttributeError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+        value: Any = field[1](raw.pop(field[0]))
+        setattr(self, name, value)
+        if not raw:
+            # all the collections are built, so their data isn't kept anymore
+            del self._raw
+
+        return value
+
+    @property
+    def lazy(self) -> bool:
+        """:class:`bool`: Whether this user keeps the JSON data to build its
+        collections on the first access (see :meth:`from_json`). It's `False`,
+        when all the collections are built"""
+        try:
+            self._raw  # pylint: disable=W0104
+            return True
+
+        except AttributeError:
+            return False
+
     @classmethod
-    def from_json(cls: Type["User"], data: Mapping[str, Any]) -> "User":
+    def from_json(cls: Type["User"], data: Mapping[str, Any], *, lazy: bool = False) -> "User":
         """:class:`User`: Converts JSON data to :class:`User`
+
+        If lazy, then lists of game objects, modes and supplies and both ratings
+        are built from the kept JSON data on the first access. It's faster, when
+        only name, rank and statistics of the player are needed. Only the data
+        of these collections is kept, and it's released, when they are built
         
         Parameters
         ----------
         data: Mapping[:class:`str`, :class:`Any`]
-            The JSON data"""
-        self = cls.__new__(cls)
-        self.name = data["name"]
-        self.rank = Rank(data["rank"])
-        self.premium = data["hasPremium"]
-        self.kills = data["kills"]
-        self.deaths = data["deaths"]
-        self.caught_golds = data["caughtGolds"]
+            The JSON data
+
+        lazy: :class:`bool`
+            Whether to build the collections on the first access. By default,
+            `False`"""
+        self = cls._from_fields(data["name"], data["rank"], data["hasPremium"], data["kills"], data["deaths"],
+                                data["caughtGolds"], data["earnedCrystals"], data["gearScore"], data["mounted"],
+                                data["presents"], data["score"], data["scoreBase"], data["scoreNext"])
+        if lazy:
+            self._raw = {k: data[k] for k, _ in LAZY_FIELDS.values()}
+            return self
+
         self.drones_played = GameObject.from_list(data["dronesPlayed"])
-        self.crystals = data["earnedCrystals"]
-        self.gear_score = data["gearScore"]
         self.hulls_played = GameObject.from_list(data["hullsPlayed"])
         self.modes_played = Mode.from_list(data["modesPlayed"])
-        self.mounted = data["mounted"]
         self.paints_played = GameObject.from_list(data["paintsPlayed"])
-        self.presents = data["presents"]
         self.previous_rating = Ratings.from_json(data["previousRating"])
         self.rating = Ratings.from_json(data["rating"])
         self.resistance_modules = GameObject.from_list(data["resistanceModules"])
-        self.score = data["score"]
-        self.score_base = data["scoreBase"]
-        self.score_next = data["scoreNext"]
         self.supplies_usage = SuppliesObject.from_list(data["suppliesUsage"])
         self.turrets_played = GameObject.from_list(data["turretsPlayed"])
         return self
+
+    @classmethod
+    def _from_fields(
+        cls: Type["User"],
+        name: str,
+        rank: int,
+        premium: bool,
+        kills: int,
+        deaths: int,
+        caught_golds: int,
+        crystals: int,
+        gear_score: int,
+        mounted: Any,
+        presents: Any,
+        score: int,
+        score_base: int,
+        score_next: int
+    ) -> "User":
+        """:class:`User`: Builds the user from values of JSON fields except its
+        collections, which are built by the caller (see :data:`LAZY_FIELDS`).
+        It's shared by :meth:`from_json` and :mod:`toapi.schemas`"""
+        self = cls.__new__(cls)
+        self.name = name
+        self.rank = Rank.shared(rank)
+        self.premium = premium
+        self.kills = kills
+        self.deaths = deaths
+        self.caught_golds = caught_golds
+        self.crystals = crystals
+        self.gear_score = gear_score
+        self.mounted = mounted
+        self.presents = presents
+        self.score = score
+        self.score_base = score_base
+        self.score_next = score_next
+        return self
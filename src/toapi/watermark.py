@@ -0,0 +1,206 @@
+"""Copyright 2023-present stngularity
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the “Software”), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE."""
+
+import asyncio
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime as dt
+from typing import Any, Dict, Final, Mapping, Optional, Union
+
+__all__ = ("Watermark", "WatermarkStore", "MemoryWatermarkStore", "FileWatermarkStore")
+
+DATE_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+
+
+class Watermark:
+    """The position of the newest article seen by :func:`toapi.sync_articles`.
+    Articles above it are new or changed
+
+    Attributes
+    ----------
+    id: Optional[:class:`int`]
+        The biggest ID of seen articles. If `None`, then IDs aren't compared
+
+    date: Optional[:class:`datetime`]
+        The latest date of seen articles. If `None`, then dates aren't compared
+
+    list_order: Optional[:class:`int`]
+        The biggest order of seen articles in the list. If an older article
+        has bigger order, then it's moved up and returned as changed. If
+        `None`, then orders aren't compared"""
+
+    __slots__ = ("id", "date", "list_order")
+
+    def __init__(self, id: Optional[int] = None, date: Optional[dt] = None, list_order: Optional[int] = None) -> None:
+        self.id: Optional[int] = id
+        self.date: Optional[dt] = date
+        self.list_order: Optional[int] = list_order
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, date={self.date!r}, list_order={self.list_order})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Watermark) and \
+            (other.id, other.date, other.list_order) == (self.id, self.date, self.list_order)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def is_new(self, data: Mapping[str, Any]) -> bool:
+        """:class:`bool`: Whether the article (its JSON data) is published after
+        this watermark. If nothing is compared, then every article is new
+
+        Parameters
+        ----------
+        data: Mapping[:class:`str`, :class:`Any`]
+            The JSON data of the article"""
+        if self.id is None and self.date is None:
+            return True
+
+        # dates of the API are sorted as strings, so they aren't parsed
+        return (self.id is not None and data["id"] > self.id) or \
+            (self.date is not None and data["date"] > self.date.strftime(DATE_FORMAT))
+
+    def is_changed(self, data: Mapping[str, Any]) -> bool:
+        """:class:`bool`: Whether the old article (its JSON data) is moved above
+        this watermark
+
+        Parameters
+        ----------
+        data: Mapping[:class:`str`, :class:`Any`]
+            The JSON data of the article"""
+        return self.list_order is not None and data["list_order"] > self.list_order
+
+    def advance(self, data: Mapping[str, Any]) -> None:
+        """Moves this watermark to the article (its JSON data), if it's newer
+
+        Parameters
+        ----------
+        data: Mapping[:class:`str`, :class:`Any`]
+            The JSON data of the article"""
+        self.id = data["id"] if self.id is None else max(self.id, data["id"])
+        self.list_order = data["list_order"] if self.list_order is None else max(self.list_order, data["list_order"])
+        date: dt = dt.strptime(data["date"], DATE_FORMAT)
+        self.date = date if self.date is None else max(self.date, date)
+
+    def copy(self) -> "Watermark":
+        """:class:`Watermark`: Returns the copy of this watermark"""
+        return Watermark(self.id, self.date, self.list_order)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, :class:`Any`]: Converts the watermark to JSON"""
+        return {"id": self.id, "date": None if self.date is None else self.date.strftime(DATE_FORMAT),
+                "list_order": self.list_order}
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "Watermark":
+        """:class:`Watermark`: Converts JSON to the watermark
+
+        Parameters
+        ----------
+        data: Mapping[:class:`str`, :class:`Any`]
+            The JSON data"""
+        date: Optional[str] = data.get("date")
+        return cls(data.get("id"), None if date is None else dt.strptime(date, DATE_FORMAT), data.get("list_order"))
+
+
+class WatermarkStore(ABC):
+    """The base class for stores, which persist watermarks of
+    :func:`toapi.sync_articles` between runs. Override it to keep watermarks
+    in a database or another storage"""
+
+    @abstractmethod
+    async def load(self, key: str) -> Optional[Watermark]:
+        """Optional[:class:`Watermark`]: Returns the saved watermark, if it
+        exists
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the watermark"""
+
+    @abstractmethod
+    async def save(self, key: str, watermark: Watermark) -> None:
+        """Saves the watermark
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the watermark
+
+        watermark: :class:`Watermark`
+            The watermark to save"""
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    """The store, which keeps watermarks in memory of the process"""
+
+    def __init__(self) -> None:
+        self._watermarks: Dict[str, Watermark] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(watermarks={len(self._watermarks)})"
+
+    async def load(self, key: str) -> Optional[Watermark]:
+        watermark: Optional[Watermark] = self._watermarks.get(key)
+        return None if watermark is None else watermark.copy()
+
+    async def save(self, key: str, watermark: Watermark) -> None:
+        self._watermarks[key] = watermark.copy()
+
+
+class FileWatermarkStore(WatermarkStore):
+    """The store, which keeps watermarks in JSON file. The file is read and
+    written in the default executor of the loop, so it doesn't block other
+    tasks, and replaced atomically, so it isn't corrupted, if the process is
+    stopped while saving
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, os.PathLike[:class:`str`]]
+        The path to the file. It's created on the first save"""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path: str = os.fspath(path)
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+
+        except FileNotFoundError:
+            return {}
+
+    def _load(self, key: str) -> Optional[Watermark]:
+        with self._lock:
+            data: Optional[Mapping[str, Any]] = self._read().get(key)
+
+        return None if data is None else Watermark.from_json(data)
+
+    def _save(self, key: str, watermark: Watermark) -> None:
+        # the lock keeps saves of different keys from overwriting each other
+        with self._lock:
+            data: Dict[str, Any] = self._read()
+            data[key] = watermark.to_json()
+            temporary: str = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+
+            os.replace(temporary, self.path)
+
+    async def load(self, key: str) -> Optional[Watermark]:
+        return await asyncio.get_running_loop().run_in_executor(None, self._load, key)
+
+    async def save(self, key: str, watermark: Watermark) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._save, key, watermark.copy())